@@ -1,17 +1,25 @@
+from collections.abc import AsyncIterator
+from functools import lru_cache
 from typing import Annotated
 
 from fastapi import Depends
 
+from infrastructure.cache.ttl_cache import AsyncTTLCache
 from infrastructure.config.settings import Settings, get_settings
-from infrastructure.database.connection import DatabaseConnectionPool, get_pool
+from infrastructure.database.connection import (
+    DatabaseConnectionPool,
+    RequestConnection,
+    get_pool,
+)
 from infrastructure.database.query_validator import QueryValidator
 from infrastructure.database.repository import PostgreSQLRepository
 from use_cases.execute_query import ExecuteQueryUseCase
-from use_cases.get_table_schema import GetTableSchemaUseCase
-from use_cases.get_tables import GetTablesUseCase
+from use_cases.get_table_schema import GetTableSchemaUseCase, SchemaCache
+from use_cases.get_tables import GetTablesUseCase, TablesCache
 
 
 # Settings dependency
+@lru_cache(maxsize=1)
 def get_app_settings() -> Settings:
     """FastAPI dependency for settings."""
     return get_settings()
@@ -21,24 +29,41 @@ SettingsDep = Annotated[Settings, Depends(get_app_settings)]
 
 
 # Database pool dependency
-def get_database_pool(settings: SettingsDep) -> DatabaseConnectionPool:
+@lru_cache(maxsize=1)
+def get_database_pool() -> DatabaseConnectionPool:
     """FastAPI dependency for database pool."""
-    return get_pool(settings)
+    return get_pool(get_app_settings())
 
 
 PoolDep = Annotated[DatabaseConnectionPool, Depends(get_database_pool)]
 
 
+# Connection dependency (cached per request, released after the response is sent)
+async def get_connection(pool: PoolDep) -> AsyncIterator[RequestConnection]:
+    """FastAPI dependency for a pooled connection shared by the whole request."""
+    connection = RequestConnection(pool)
+    try:
+        yield connection
+    finally:
+        await connection.release()
+
+
+ConnectionDep = Annotated[RequestConnection, Depends(get_connection)]
+
+
 # Repository dependency
-def get_repository(pool: PoolDep, settings: SettingsDep) -> PostgreSQLRepository:
+def get_repository(connection: ConnectionDep, settings: SettingsDep) -> PostgreSQLRepository:
     """FastAPI dependency for database repository."""
-    return PostgreSQLRepository(pool, schema=settings.db_schema)
+    return PostgreSQLRepository(
+        connection, schema=settings.db_schema, batch_size=settings.query_batch_size
+    )
 
 
 RepositoryDep = Annotated[PostgreSQLRepository, Depends(get_repository)]
 
 
-# Query validator dependency
+# Query validator dependency (stateless, shared across requests)
+@lru_cache(maxsize=1)
 def get_query_validator() -> QueryValidator:
     """FastAPI dependency for query validator."""
     return QueryValidator()
@@ -47,15 +72,34 @@ def get_query_validator() -> QueryValidator:
 ValidatorDep = Annotated[QueryValidator, Depends(get_query_validator)]
 
 
+# Catalog cache dependencies (shared across requests)
+@lru_cache(maxsize=1)
+def get_tables_cache() -> TablesCache:
+    """FastAPI dependency for the tables list cache."""
+    settings = get_app_settings()
+    return AsyncTTLCache(maxsize=settings.catalog_cache_size, ttl=settings.catalog_cache_ttl)
+
+
+@lru_cache(maxsize=1)
+def get_schema_cache() -> SchemaCache:
+    """FastAPI dependency for the table schema cache."""
+    settings = get_app_settings()
+    return AsyncTTLCache(maxsize=settings.catalog_cache_size, ttl=settings.catalog_cache_ttl)
+
+
+TablesCacheDep = Annotated[TablesCache, Depends(get_tables_cache)]
+SchemaCacheDep = Annotated[SchemaCache, Depends(get_schema_cache)]
+
+
 # Use case dependencies
-def get_tables_use_case(repo: RepositoryDep) -> GetTablesUseCase:
+def get_tables_use_case(repo: RepositoryDep, cache: TablesCacheDep) -> GetTablesUseCase:
     """FastAPI dependency for GetTablesUseCase."""
-    return GetTablesUseCase(repo)
+    return GetTablesUseCase(repo, cache)
 
 
-def get_schema_use_case(repo: RepositoryDep) -> GetTableSchemaUseCase:
+def get_schema_use_case(repo: RepositoryDep, cache: SchemaCacheDep) -> GetTableSchemaUseCase:
     """FastAPI dependency for GetTableSchemaUseCase."""
-    return GetTableSchemaUseCase(repo)
+    return GetTableSchemaUseCase(repo, cache)
 
 
 def get_execute_query_use_case(
@@ -0,0 +1,36 @@
+from typing import Any
+
+import msgspec
+from fastapi import FastAPI
+from fastapi.openapi.utils import get_openapi
+
+_REF_TEMPLATE = "#/components/schemas/{name}"
+
+
+def struct_response(struct_type: type[msgspec.Struct]) -> dict[int | str, dict[str, Any]]:
+    """Route `responses=` entry documenting a msgspec Struct as the 200 body.
+
+    FastAPI only understands Pydantic models in `response_model`, so Struct
+    responses are referenced by name and registered with `install_struct_schemas`.
+    """
+    schema = {"$ref": _REF_TEMPLATE.format(name=struct_type.__name__)}
+    return {200: {"content": {"application/json": {"schema": schema}}}}
+
+
+def install_struct_schemas(app: FastAPI, *struct_types: type[msgspec.Struct]) -> None:
+    """Add JSON schemas of msgspec Structs (and nested Structs) to OpenAPI components."""
+
+    def openapi() -> dict[str, Any]:
+        if app.openapi_schema is None:
+            schema = get_openapi(
+                title=app.title,
+                version=app.version,
+                description=app.description,
+                routes=app.routes,
+            )
+            _, components = msgspec.json.schema_components(struct_types, ref_template=_REF_TEMPLATE)
+            schema.setdefault("components", {}).setdefault("schemas", {}).update(components)
+            app.openapi_schema = schema
+        return app.openapi_schema
+
+    app.openapi = openapi  # type: ignore[method-assign]
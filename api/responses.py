@@ -0,0 +1,115 @@
+from collections.abc import AsyncIterator
+from typing import Any, Self
+
+import anyio
+import anyio.lowlevel
+import msgspec
+import orjson
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic_core import PydanticSerializationError, to_jsonable_python
+from starlette.types import Receive, Scope, Send
+
+from domain.entities.query_result import QueryResult
+
+# Datetimes go through orjson_default too, so they render as Pydantic renders them
+_ORJSON_OPTIONS = orjson.OPT_NON_STR_KEYS | orjson.OPT_PASSTHROUGH_DATETIME
+
+
+def orjson_default(obj: Any) -> Any:
+    """Encode values orjson doesn't render natively (Decimal, timedelta, bytes, ...).
+
+    Uses Pydantic's JSON-mode conversion, so values come out as they did when
+    responses were serialized by Pydantic: Decimal as an exact string, timedelta
+    as an ISO 8601 duration, UTC datetimes with a "Z" suffix. Values Pydantic
+    can't convert either still render, so a streamed result isn't cut off: bytes
+    that aren't UTF-8 in Postgres' hex bytea format, anything else (e.g. a range)
+    as its string form.
+    """
+    try:
+        return to_jsonable_python(obj)
+    except (PydanticSerializationError, ValueError):
+        if isinstance(obj, bytes | bytearray):
+            return "\\x" + obj.hex()
+        return str(obj)
+
+
+class ORJSONResponse(JSONResponse):
+    """JSON response serialized with orjson, bypassing `jsonable_encoder`."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, default=orjson_default, option=_ORJSON_OPTIONS)
+
+
+class MsgspecResponse(JSONResponse):
+    """JSON response rendered from a msgspec Struct by msgspec's C encoder."""
+
+    _encoder = msgspec.json.Encoder()
+
+    def render(self, content: msgspec.Struct) -> bytes:
+        return self._encoder.encode(content)
+
+
+class QueryResultResponse(StreamingResponse):
+    """Streams a query result as `{"columns": [...], "rows": [...], "row_count": N}`.
+
+    Each batch is encoded by orjson as soon as it arrives, so memory stays bounded
+    by the batch size and the client gets the first rows while the rest are fetched.
+    Build it with `create()`, which encodes the first batch before anything is sent.
+    """
+
+    def __init__(self, result: QueryResult, first_rows: bytes, first_row_count: int) -> None:
+        super().__init__(
+            self._render(result, first_rows, first_row_count), media_type="application/json"
+        )
+        self._batches = result.batches
+
+    @classmethod
+    async def create(cls, result: QueryResult) -> Self:
+        """Create the response, encoding the first batch up front.
+
+        Once the status line is sent an encoding error can only cut the body off,
+        so a result that fails on its first batch is reported as an error instead.
+
+        Raises:
+            orjson.JSONEncodeError: If the first batch can't be encoded
+        """
+        try:
+            batch: list[tuple[Any, ...]] = await anext(result.batches, [])
+            rows = _encode_rows(batch)
+        except BaseException:
+            await result.batches.aclose()
+            raise
+        return cls(result, rows, len(batch))
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        try:
+            await super().__call__(scope, receive, send)
+        finally:
+            # A client that disconnects mid-stream leaves the batches unfinished;
+            # close them so the cursor's transaction ends before the connection
+            # goes back to the pool
+            await self._batches.aclose()
+
+    @staticmethod
+    async def _render(result: QueryResult, rows: bytes, row_count: int) -> AsyncIterator[bytes]:
+        yield b'{"columns":' + orjson.dumps(result.columns) + b',"rows":[' + rows
+
+        while True:
+            # A client disconnect cancels the stream. Interrupting a fetch would
+            # leave the cursor's transaction unable to roll back, so let it finish
+            # and stop right after it instead
+            with anyio.CancelScope(shield=True):
+                batch = await anext(result.batches, None)
+            await anyio.lowlevel.checkpoint_if_cancelled()
+            if batch is None:
+                break
+            rows = _encode_rows(batch)
+            yield b"," + rows if row_count else rows
+            row_count += len(batch)
+
+        yield b'],"row_count":' + str(row_count).encode() + b"}"
+
+
+def _encode_rows(batch: list[tuple[Any, ...]]) -> bytes:
+    """Encode a batch as comma-separated JSON arrays, without the enclosing brackets."""
+    return orjson.dumps(batch, default=orjson_default, option=_ORJSON_OPTIONS)[1:-1]
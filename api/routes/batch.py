@@ -0,0 +1,63 @@
+import msgspec
+from fastapi import APIRouter
+
+from api.dependencies import ConnectionDep, GetSchemaUseCaseDep, GetTablesUseCaseDep
+from api.openapi import struct_response
+from api.responses import MsgspecResponse
+from api.routes.tables import build_tables_response
+from api.schemas.requests import BatchOperation, BatchRequest, TablesOperation
+from api.schemas.responses import BatchResponse, BatchResultResponse, ErrorResponse
+from infrastructure.exceptions.database_exceptions import TableNotFoundError
+from use_cases.get_table_schema import GetTableSchemaUseCase
+from use_cases.get_tables import GetTablesUseCase
+
+router = APIRouter(prefix="/api", tags=["batch"])
+
+_encoder = msgspec.json.Encoder()
+
+
+@router.post("/batch", responses=struct_response(BatchResponse))
+async def execute_batch(
+    request: BatchRequest,
+    tables_use_case: GetTablesUseCaseDep,
+    schema_use_case: GetSchemaUseCaseDep,
+    connection: ConnectionDep,
+) -> MsgspecResponse:
+    """Run several catalog operations in one request.
+
+    Each result carries the status and body the standalone endpoint would return,
+    so a client gets a tables page and several schemas in a single round trip.
+    Operations run one after another.
+    """
+    results = []
+    for operation in request.operations:
+        try:
+            results.append(await _run_operation(operation, tables_use_case, schema_use_case))
+        finally:
+            # Don't hold a connection while a later operation waits for a lookup
+            # another request is running, or both can end up waiting on the pool
+            await connection.release()
+
+    return MsgspecResponse(BatchResponse(results=results))
+
+
+async def _run_operation(
+    operation: BatchOperation,
+    tables_use_case: GetTablesUseCase,
+    schema_use_case: GetTableSchemaUseCase,
+) -> BatchResultResponse:
+    """Run a single batch operation."""
+    if isinstance(operation, TablesOperation):
+        tables, pagination = await tables_use_case.execute(
+            page=operation.page, page_size=operation.page_size
+        )
+        body = _encoder.encode(build_tables_response(tables, pagination))
+        return BatchResultResponse(status=200, body=msgspec.Raw(body))
+
+    try:
+        payload = await schema_use_case.execute(table_name=operation.table_name)
+    except TableNotFoundError as e:
+        body = _encoder.encode(ErrorResponse(detail=str(e)))
+        return BatchResultResponse(status=404, body=msgspec.Raw(body))
+
+    return BatchResultResponse(status=200, body=msgspec.Raw(payload))
@@ -1,6 +1,9 @@
+import orjson
 from fastapi import APIRouter, HTTPException, status
 
 from api.dependencies import ExecuteQueryUseCaseDep
+from api.openapi import struct_response
+from api.responses import QueryResultResponse
 from api.schemas.requests import QueryRequest
 from api.schemas.responses import QueryResponse
 from infrastructure.exceptions.database_exceptions import ForbiddenQueryError, QueryExecutionError
@@ -8,11 +11,11 @@ from infrastructure.exceptions.database_exceptions import ForbiddenQueryError, Q
 router = APIRouter(prefix="/api", tags=["query"])
 
 
-@router.post("/query", response_model=QueryResponse)
+@router.post("/query", responses=struct_response(QueryResponse))
 async def execute_query(
     request: QueryRequest,
     use_case: ExecuteQueryUseCaseDep,
-) -> QueryResponse:
+) -> QueryResultResponse:
     """Execute SQL SELECT query.
 
     Only SELECT queries are allowed. INSERT, UPDATE, DELETE, DROP, etc. are forbidden.
@@ -30,8 +33,11 @@ async def execute_query(
             detail=str(e),
         ) from e
 
-    return QueryResponse(
-        columns=result.columns,
-        rows=result.rows,
-        row_count=result.row_count,
-    )
+    # Rows are streamed as they are fetched; QueryResponse only documents the shape
+    try:
+        return await QueryResultResponse.create(result)
+    except orjson.JSONEncodeError as e:
+        raise HTTPException(
+            status_code=status.HTTP_500_INTERNAL_SERVER_ERROR,
+            detail=f"Query result could not be encoded: {str(e)}",
+        ) from e
@@ -1,3 +1,5 @@
+from typing import Annotated, Literal
+
 from pydantic import BaseModel, Field
 
 
@@ -7,5 +9,36 @@ class QueryRequest(BaseModel):
     query: str = Field(
         description="SQL SELECT query to execute",
         min_length=1,
+        # Bounds the keyword scan in QueryValidator (linear in query length)
+        max_length=100_000,
         examples=["SELECT * FROM users LIMIT 10"],
     )
+
+
+class TablesOperation(BaseModel):
+    """Batch operation equivalent to GET /api/tables."""
+
+    op: Literal["tables"]
+    page: int = Field(default=1, ge=1, description="Page number")
+    page_size: int = Field(default=10, ge=1, le=100, description="Items per page")
+
+
+class SchemaOperation(BaseModel):
+    """Batch operation equivalent to GET /api/tables/{table_name}/schema."""
+
+    op: Literal["schema"]
+    table_name: str = Field(description="Table name")
+
+
+BatchOperation = Annotated[TablesOperation | SchemaOperation, Field(discriminator="op")]
+
+
+class BatchRequest(BaseModel):
+    """Request schema for POST /api/batch endpoint."""
+
+    operations: list[BatchOperation] = Field(
+        description="Catalog operations, results are returned in the same order",
+        min_length=1,
+        max_length=100,
+        examples=[[{"op": "tables", "page_size": 5}, {"op": "schema", "table_name": "users"}]],
+    )
@@ -1,20 +1,20 @@
-from typing import Any
+from typing import Annotated, Any
 
-from pydantic import BaseModel, Field
+import msgspec
 
 
 # Tables endpoint response schemas
-class TableResponse(BaseModel):
-    """Single table metadata."""
+class TableResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Single table metadata. Null size/comment are omitted from the payload."""
 
     table_name: str
     table_type: str
-    table_size: str | None
+    table_size: str | None = None
     column_count: int
-    table_comment: str | None
+    table_comment: str | None = None
 
 
-class PaginationResponse(BaseModel):
+class PaginationResponse(msgspec.Struct):
     """Pagination metadata."""
 
     page: int
@@ -23,7 +23,7 @@ class PaginationResponse(BaseModel):
     total_pages: int
 
 
-class TablesResponse(BaseModel):
+class TablesResponse(msgspec.Struct):
     """Response for GET /api/tables."""
 
     tables: list[TableResponse]
@@ -31,18 +31,18 @@ class TablesResponse(BaseModel):
 
 
 # Schema endpoint response schemas
-class ColumnResponse(BaseModel):
-    """Single column metadata."""
+class ColumnResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Single column metadata. A null comment is omitted from the payload."""
 
     column_name: str
     data_type: str
     is_nullable: bool
     is_primary_key: bool
     is_foreign_key: bool
-    column_comment: str | None
+    column_comment: str | None = None
 
 
-class IndexResponse(BaseModel):
+class IndexResponse(msgspec.Struct):
     """Single index metadata."""
 
     index_name: str
@@ -51,27 +51,47 @@ class IndexResponse(BaseModel):
     is_primary: bool
 
 
-class SchemaResponse(BaseModel):
-    """Response for GET /api/tables/{table_name}/schema."""
+class SchemaResponse(msgspec.Struct, kw_only=True, omit_defaults=True):
+    """Response for GET /api/tables/{table_name}/schema. A null comment is omitted."""
 
     table_name: str
-    table_comment: str | None
+    table_comment: str | None = None
     column_count: int
     columns: list[ColumnResponse]
     indexes: list[IndexResponse]
 
 
 # Query endpoint response schemas
-class QueryResponse(BaseModel):
+class QueryResponse(msgspec.Struct):
     """Response for POST /api/query."""
 
-    columns: list[str] = Field(description="Column names")
-    rows: list[list[Any]] = Field(description="Query result rows")
-    row_count: int = Field(description="Number of rows returned")
+    columns: Annotated[list[str], msgspec.Meta(description="Column names")]
+    rows: Annotated[list[list[Any]], msgspec.Meta(description="Query result rows")]
+    row_count: Annotated[int, msgspec.Meta(description="Number of rows returned")]
+
+
+# Batch endpoint response schemas
+class BatchResultResponse(msgspec.Struct):
+    """Result of a single batch operation."""
+
+    status: Annotated[
+        int, msgspec.Meta(description="HTTP status the standalone endpoint would return")
+    ]
+    body: Annotated[
+        msgspec.Raw, msgspec.Meta(description="Body the standalone endpoint would return")
+    ]
+
+
+class BatchResponse(msgspec.Struct):
+    """Response for POST /api/batch."""
+
+    results: Annotated[
+        list[BatchResultResponse], msgspec.Meta(description="Results in operation order")
+    ]
 
 
 # Error response schema
-class ErrorResponse(BaseModel):
+class ErrorResponse(msgspec.Struct):
     """Standard error response."""
 
     detail: str
@@ -1,20 +1,22 @@
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 
 
 @dataclass(frozen=True)
 class Pagination:
-    """Domain entity representing pagination metadata."""
+    """Domain entity representing pagination metadata.
+
+    `total_pages` and `offset` are derived once at construction.
+    """
 
     page: int
     page_size: int
     total_count: int
+    total_pages: int = field(init=False)
+    offset: int = field(init=False)
 
-    @property
-    def total_pages(self) -> int:
-        """Calculate total pages from count and size."""
-        return (self.total_count + self.page_size - 1) // self.page_size
-
-    @property
-    def offset(self) -> int:
-        """Calculate SQL OFFSET from page and size."""
-        return (self.page - 1) * self.page_size
+    def __post_init__(self) -> None:
+        # Frozen dataclass: derived fields have to bypass __setattr__
+        object.__setattr__(
+            self, "total_pages", (self.total_count + self.page_size - 1) // self.page_size
+        )
+        object.__setattr__(self, "offset", (self.page - 1) * self.page_size)
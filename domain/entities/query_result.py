@@ -1,11 +1,16 @@
+from collections.abc import AsyncGenerator
 from dataclasses import dataclass
 from typing import Any
 
 
 @dataclass(frozen=True)
 class QueryResult:
-    """Domain entity representing SQL query execution result."""
+    """Domain entity representing SQL query execution result.
+
+    Rows are produced lazily in batches while the database streams them,
+    so `batches` can be consumed only once. Close it (`aclose()`) when the rows
+    aren't read to the end, so the database side is released.
+    """
 
     columns: list[str]
-    rows: list[list[Any]]
-    row_count: int
+    batches: AsyncGenerator[list[tuple[Any, ...]], None]
@@ -1,6 +1,5 @@
 from typing import Protocol
 
-from domain.entities.column_info import ColumnInfo, IndexInfo
 from domain.entities.pagination import Pagination
 from domain.entities.query_result import QueryResult
 from domain.entities.table_info import TableInfo
@@ -24,16 +23,17 @@ class DatabaseRepositoryProtocol(Protocol):
         """
         ...
 
-    async def get_table_schema(
-        self, table_name: str
-    ) -> tuple[list[ColumnInfo], list[IndexInfo], str | None]:
+    async def get_table_schema(self, table_name: str) -> str:
         """Get detailed schema for specific table.
 
+        The schema is assembled by the database itself, so it is returned as a
+        serialized JSON document rather than as entities.
+
         Args:
             table_name: Name of the table
 
         Returns:
-            Tuple of (columns, indexes, table_comment)
+            JSON document with table comment, columns and indexes
 
         Raises:
             TableNotFoundError: If table doesn't exist
@@ -47,7 +47,7 @@ class DatabaseRepositoryProtocol(Protocol):
             query: SQL SELECT query (pre-validated)
 
         Returns:
-            Query execution result
+            Query execution result with rows streamed in batches
 
         Raises:
             QueryExecutionError: If query fails
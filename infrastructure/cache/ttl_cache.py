@@ -0,0 +1,66 @@
+import asyncio
+from collections.abc import Awaitable, Callable, Hashable
+
+from cachetools import TTLCache
+
+
+class AsyncTTLCache[K: Hashable, V]:
+    """In-memory TTL cache for async lookups.
+
+    Concurrent misses for the same key share one lookup, so a burst of identical
+    requests runs it once per TTL window; misses for different keys run in
+    parallel. A zero TTL disables the cache and every call runs the lookup.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._enabled = ttl > 0
+        self._cache: TTLCache[K, V] = TTLCache(maxsize=maxsize, ttl=ttl)
+        self._in_flight: dict[K, asyncio.Future[V]] = {}
+
+    async def get_or_set(self, key: K, factory: Callable[[], Awaitable[V]]) -> V:
+        """Return cached value for key, computing and storing it on a miss.
+
+        Args:
+            key: Cache key
+            factory: Coroutine function producing the value on a miss
+
+        Returns:
+            Cached or freshly computed value
+        """
+        if not self._enabled:
+            return await factory()
+
+        while True:
+            if key in self._cache:
+                return self._cache[key]
+
+            flight = self._in_flight.get(key)
+            if flight is None:
+                break
+
+            # Shielded, so a cancelled waiter doesn't cancel the lookup it shares
+            try:
+                return await asyncio.shield(flight)
+            except asyncio.CancelledError:
+                if not flight.cancelled():
+                    raise
+                # The caller running the lookup was cancelled, try again
+
+        flight = asyncio.get_running_loop().create_future()
+        self._in_flight[key] = flight
+        try:
+            value = await factory()
+        except asyncio.CancelledError:
+            flight.cancel()
+            raise
+        except Exception as e:
+            flight.set_exception(e)
+            # Waiters re-raise the error; don't report it as never retrieved
+            flight.exception()
+            raise
+        finally:
+            del self._in_flight[key]
+
+        self._cache[key] = value
+        flight.set_result(value)
+        return value
@@ -23,6 +23,32 @@ class Settings(BaseSettings):
     db_pool_min_size: int = Field(default=5, ge=1, le=100)
     db_pool_max_size: int = Field(default=20, ge=1, le=100)
     db_pool_timeout: float = Field(default=30.0, ge=1.0)
+    db_pool_max_inactive_lifetime: float = Field(
+        default=300.0,
+        ge=0.0,
+        description="Seconds an idle connection is kept open (0 keeps connections forever)",
+    )
+    db_statement_cache_size: int = Field(
+        default=1024,
+        ge=0,
+        description="Prepared statements cached per connection (0 disables the cache)",
+    )
+
+    # Query settings
+    query_batch_size: int = Field(
+        default=1000,
+        ge=1,
+        le=100000,
+        description="Rows fetched from the cursor per batch when streaming query results",
+    )
+
+    # Catalog cache settings (tables list and table schemas)
+    catalog_cache_ttl: float = Field(
+        default=10.0,
+        ge=0.0,
+        description="Seconds catalog lookups are served from memory (0 disables caching)",
+    )
+    catalog_cache_size: int = Field(default=256, ge=1, le=100000)
 
     # API settings
     api_host: str = Field(default="0.0.0.0")
@@ -1,8 +1,9 @@
-from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
 
 import asyncpg  # type: ignore[import-untyped]
 
 from infrastructure.config.settings import Settings
+from infrastructure.database.queries import COUNT_TABLES_QUERY, TABLE_SCHEMA_QUERY, TABLES_QUERY
 
 
 class DatabaseConnectionPool:
@@ -13,26 +14,77 @@ class DatabaseConnectionPool:
         self._pool: asyncpg.Pool | None = None
 
     async def connect(self) -> None:
-        """Create connection pool."""
+        """Create connection pool.
+
+        asyncpg opens `min_size` connections up front, so the pool is warm once this
+        returns. Idle connections are recycled after `db_pool_max_inactive_lifetime`,
+        which also drops their prepared statement cache; new connections are primed
+        with the catalog queries by `_prepare_catalog_queries`. Priming is skipped
+        when the statement cache is disabled (`db_statement_cache_size=0`), as it
+        would only add round-trips to each new connection.
+        """
+        statement_cache_size = self._settings.db_statement_cache_size
         self._pool = await asyncpg.create_pool(
             self._settings.database_url,
             min_size=self._settings.db_pool_min_size,
             max_size=self._settings.db_pool_max_size,
             timeout=self._settings.db_pool_timeout,
+            max_inactive_connection_lifetime=self._settings.db_pool_max_inactive_lifetime,
+            statement_cache_size=statement_cache_size,
+            init=self._prepare_catalog_queries if statement_cache_size else None,
         )
 
+    async def _prepare_catalog_queries(self, conn: asyncpg.Connection) -> None:
+        """Put the catalog queries into a new connection's statement cache.
+
+        asyncpg prepares and caches statements on first use, so running each query
+        once with arguments that match nothing moves the parse/describe round-trips
+        out of the first catalog request served by this connection.
+        """
+        schema = self._settings.db_schema
+        await conn.fetch(TABLES_QUERY, schema, 0, 0)
+        await conn.fetchval(COUNT_TABLES_QUERY, schema)
+        await conn.fetchval(TABLE_SCHEMA_QUERY, schema, "")
+
     async def disconnect(self) -> None:
         """Close connection pool."""
         if self._pool:
             await self._pool.close()
 
-    async def acquire(self) -> AsyncGenerator[asyncpg.Connection, None]:
-        """Acquire connection from pool."""
+    def acquire(self) -> asyncpg.pool.PoolAcquireContext:
+        """Acquire connection from pool.
+
+        Returns asyncpg's own acquire context, to be used as
+        `async with pool.acquire() as conn:`.
+        """
         if not self._pool:
             raise RuntimeError("Connection pool not initialized")
 
-        async with self._pool.acquire() as connection:
-            yield connection
+        return self._pool.acquire()
+
+
+class RequestConnection:
+    """Request-scoped connection, checked out from the pool on first use.
+
+    Requests answered without touching the database (e.g. from cache) never
+    take a connection from the pool.
+    """
+
+    def __init__(self, pool: DatabaseConnectionPool) -> None:
+        self._pool = pool
+        self._stack = AsyncExitStack()
+        self._connection: asyncpg.Connection | None = None
+
+    async def get(self) -> asyncpg.Connection:
+        """Return the request's connection, acquiring it on the first call."""
+        if self._connection is None:
+            self._connection = await self._stack.enter_async_context(self._pool.acquire())
+        return self._connection
+
+    async def release(self) -> None:
+        """Return the connection to the pool if it was acquired."""
+        await self._stack.aclose()
+        self._connection = None
 
 
 # Global pool instance
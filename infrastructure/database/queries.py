@@ -0,0 +1,103 @@
+"""Catalog queries used by PostgreSQLRepository.
+
+Kept at module level so the connection pool can prepare them up front.
+"""
+
+# Tables with metadata; the window count is evaluated before LIMIT,
+# so every row carries the total number of matching tables
+TABLES_QUERY = """
+    SELECT
+        c.relname AS table_name,
+        CASE c.relkind
+            WHEN 'r' THEN 'BASE TABLE'
+            WHEN 'v' THEN 'VIEW'
+            WHEN 'm' THEN 'MATERIALIZED VIEW'
+        END AS table_type,
+        pg_size_pretty(pg_total_relation_size(c.oid)) AS table_size,
+        (
+            SELECT count(*) FROM pg_attribute
+            WHERE attrelid = c.oid AND attnum > 0 AND NOT attisdropped
+        ) AS column_count,
+        obj_description(c.oid, 'pg_class') AS table_comment,
+        count(*) OVER () AS total_count
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = $1
+      AND c.relkind IN ('r', 'v', 'm')
+    ORDER BY c.relname
+    LIMIT $2 OFFSET $3
+"""
+
+# Count query, only needed for pages past the end
+COUNT_TABLES_QUERY = """
+    SELECT count(*)
+    FROM pg_class c
+    JOIN pg_namespace n ON n.oid = c.relnamespace
+    WHERE n.nspname = $1
+      AND c.relkind IN ('r', 'v', 'm')
+"""
+
+# The whole schema response built as one JSON document; null comments are
+# stripped, and no row means the table doesn't exist
+TABLE_SCHEMA_QUERY = """
+    WITH target AS (
+        SELECT c.oid, c.relname
+        FROM pg_class c
+        JOIN pg_namespace n ON n.oid = c.relnamespace
+        WHERE n.nspname = $1 AND c.relname = $2
+    )
+    SELECT json_strip_nulls(json_build_object(
+        'table_name', t.relname,
+        'table_comment', obj_description(t.oid, 'pg_class'),
+        'column_count', json_array_length(cols.columns),
+        'columns', cols.columns,
+        'indexes', idxs.indexes
+    ))
+    FROM target t
+    CROSS JOIN LATERAL (
+        SELECT COALESCE(
+            json_agg(
+                json_build_object(
+                    'column_name', a.attname,
+                    'data_type', pg_catalog.format_type(a.atttypid, a.atttypmod),
+                    'is_nullable', NOT a.attnotnull,
+                    'is_primary_key', EXISTS (
+                        SELECT 1 FROM pg_constraint con
+                        WHERE con.conrelid = a.attrelid
+                          AND con.contype = 'p'
+                          AND a.attnum = ANY(con.conkey)
+                    ),
+                    'is_foreign_key', EXISTS (
+                        SELECT 1 FROM pg_constraint con
+                        WHERE con.conrelid = a.attrelid
+                          AND con.contype = 'f'
+                          AND a.attnum = ANY(con.conkey)
+                    ),
+                    'column_comment', col_description(a.attrelid, a.attnum)
+                )
+                ORDER BY a.attnum
+            ),
+            '[]'
+        ) AS columns
+        FROM pg_attribute a
+        WHERE a.attrelid = t.oid
+          AND a.attnum > 0
+          AND NOT a.attisdropped
+    ) cols
+    CROSS JOIN LATERAL (
+        SELECT COALESCE(json_agg(idx ORDER BY idx.index_name), '[]') AS indexes
+        FROM (
+            SELECT
+                i.relname AS index_name,
+                ARRAY_AGG(a.attname ORDER BY a.attnum) AS columns,
+                ix.indisunique AS is_unique,
+                ix.indisprimary AS is_primary
+            FROM pg_index ix
+            JOIN pg_class i ON i.oid = ix.indexrelid
+            JOIN pg_attribute a
+              ON a.attrelid = ix.indrelid AND a.attnum = ANY(ix.indkey)
+            WHERE ix.indrelid = t.oid
+            GROUP BY i.relname, ix.indisunique, ix.indisprimary
+        ) idx
+    ) idxs
+"""
@@ -16,6 +16,17 @@ class QueryValidator:
         "REVOKE",
     ]
 
+    # Read-only statements start with SELECT or WITH, after any leading
+    # whitespace, comments or opening parentheses. The repetition is possessive:
+    # with backtracking, a long run of whitespace takes exponential time to reject
+    _READ_ONLY_PREFIX = re.compile(
+        r"(?:\s+|--[^\n]*|/\*.*?\*/|\()*+(?:SELECT|WITH)\b", re.IGNORECASE | re.DOTALL
+    )
+
+    # All keywords in one pass; word boundaries match whole words only. Matched
+    # case-sensitively against the uppercased query, about twice as fast as IGNORECASE
+    _FORBIDDEN_PATTERN = re.compile(rf"\b(?:{'|'.join(FORBIDDEN_KEYWORDS)})\b")
+
     def is_safe_query(self, query: str) -> bool:
         """Check if query contains only SELECT operations.
 
@@ -25,16 +36,23 @@ class QueryValidator:
         Returns:
             True if query is safe (SELECT only)
         """
-        query_upper = query.upper()
+        # The prefix check is anchored and rejects other statements early; the
+        # keyword scan still runs, since a WITH can wrap data-modifying statements
+        return (
+            self.is_read_only_statement(query)
+            and self._FORBIDDEN_PATTERN.search(query.upper()) is None
+        )
 
-        # Check for forbidden keywords
-        for keyword in self.FORBIDDEN_KEYWORDS:
-            # Use word boundary to match whole words only
-            pattern = rf"\b{keyword}\b"
-            if re.search(pattern, query_upper):
-                return False
+    def is_read_only_statement(self, query: str) -> bool:
+        """Check if query starts with SELECT or WITH.
 
-        return True
+        Args:
+            query: SQL query to check
+
+        Returns:
+            True if the statement is a SELECT, optionally with a WITH clause
+        """
+        return self._READ_ONLY_PREFIX.match(query) is not None
 
     def get_forbidden_keyword(self, query: str) -> str | None:
         """Get first forbidden keyword found in query.
@@ -45,11 +63,5 @@ class QueryValidator:
         Returns:
             Forbidden keyword or None
         """
-        query_upper = query.upper()
-
-        for keyword in self.FORBIDDEN_KEYWORDS:
-            pattern = rf"\b{keyword}\b"
-            if re.search(pattern, query_upper):
-                return keyword.lower()
-
-        return None
+        match = self._FORBIDDEN_PATTERN.search(query.upper())
+        return match.group(0).lower() if match else None
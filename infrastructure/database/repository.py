@@ -1,199 +1,105 @@
+from collections.abc import AsyncGenerator
+from contextlib import AsyncExitStack
+from typing import Any
+
 import asyncpg  # type: ignore[import-untyped]
 
-from domain.entities.column_info import ColumnInfo, IndexInfo
 from domain.entities.pagination import Pagination
 from domain.entities.query_result import QueryResult
 from domain.entities.table_info import TableInfo
-from infrastructure.database.connection import DatabaseConnectionPool
+from infrastructure.database.connection import RequestConnection
+from infrastructure.database.queries import (
+    COUNT_TABLES_QUERY,
+    TABLE_SCHEMA_QUERY,
+    TABLES_QUERY,
+)
 from infrastructure.exceptions.database_exceptions import QueryExecutionError, TableNotFoundError
 
 
 class PostgreSQLRepository:
-    """PostgreSQL implementation of DatabaseRepositoryProtocol."""
+    """PostgreSQL implementation of DatabaseRepositoryProtocol.
+
+    Works on a single connection owned by the caller (one per request).
+    """
 
-    def __init__(self, pool: DatabaseConnectionPool, schema: str = "public") -> None:
-        self._pool = pool
+    def __init__(
+        self, connection: RequestConnection, schema: str = "public", batch_size: int = 1000
+    ) -> None:
+        self._connection = connection
         self._schema = schema
+        self._batch_size = batch_size
 
-    async def get_tables(  # type: ignore[return]
-        self, pagination: Pagination
-    ) -> tuple[list[TableInfo], int]:
+    async def get_tables(self, pagination: Pagination) -> tuple[list[TableInfo], int]:
         """Get paginated list of tables with metadata."""
 
-        # Query for tables with metadata
-        tables_query = """
-            SELECT
-                c.relname AS table_name,
-                CASE c.relkind
-                    WHEN 'r' THEN 'BASE TABLE'
-                    WHEN 'v' THEN 'VIEW'
-                    WHEN 'm' THEN 'MATERIALIZED VIEW'
-                END AS table_type,
-                pg_size_pretty(pg_total_relation_size(c.oid)) AS table_size,
-                (
-                    SELECT count(*) FROM pg_attribute
-                    WHERE attrelid = c.oid AND attnum > 0 AND NOT attisdropped
-                ) AS column_count,
-                obj_description(c.oid, 'pg_class') AS table_comment
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE n.nspname = $1
-              AND c.relkind IN ('r', 'v', 'm')
-            ORDER BY c.relname
-            LIMIT $2 OFFSET $3
-        """
+        conn = await self._connection.get()
+
+        # Get paginated tables together with the total count
+        rows = await conn.fetch(TABLES_QUERY, self._schema, pagination.page_size, pagination.offset)
+
+        if rows:
+            total_count = rows[0]["total_count"]
+        elif pagination.offset:
+            # OFFSET skipped every row, so the window count is lost with them
+            total_count = await conn.fetchval(COUNT_TABLES_QUERY, self._schema)
+        else:
+            total_count = 0
+
+        tables = [
+            TableInfo(
+                table_name=row["table_name"],
+                table_type=row["table_type"],
+                table_size=row["table_size"],
+                column_count=row["column_count"],
+                table_comment=row["table_comment"],
+            )
+            for row in rows
+        ]
 
-        # Count query
-        count_query = """
-            SELECT count(*)
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE n.nspname = $1
-              AND c.relkind IN ('r', 'v', 'm')
-        """
+        return tables, total_count
 
-        async for conn in self._pool.acquire():
-            # Get total count
-            total_count = await conn.fetchval(count_query, self._schema)
+    async def get_table_schema(self, table_name: str) -> str:
+        """Get detailed schema for specific table as a ready-to-send JSON document."""
 
-            # Get paginated tables
-            rows = await conn.fetch(
-                tables_query, self._schema, pagination.page_size, pagination.offset
-            )
+        conn = await self._connection.get()
+        payload: str | None = await conn.fetchval(TABLE_SCHEMA_QUERY, self._schema, table_name)
+        if payload is None:
+            raise TableNotFoundError(f"Table '{table_name}' not found in schema '{self._schema}'")
 
-            tables = [
-                TableInfo(
-                    table_name=row["table_name"],
-                    table_type=row["table_type"],
-                    table_size=row["table_size"],
-                    column_count=row["column_count"],
-                    table_comment=row["table_comment"],
-                )
-                for row in rows
-            ]
-
-            return tables, total_count
-
-    async def get_table_schema(  # type: ignore[return]
-        self, table_name: str
-    ) -> tuple[list[ColumnInfo], list[IndexInfo], str | None]:
-        """Get detailed schema for specific table."""
-
-        # Check if table exists
-        exists_query = """
-            SELECT EXISTS (
-                SELECT 1 FROM pg_class c
-                JOIN pg_namespace n ON n.oid = c.relnamespace
-                WHERE n.nspname = $1 AND c.relname = $2
-            )
-        """
+        return payload
 
-        # Get table comment
-        comment_query = """
-            SELECT obj_description(c.oid, 'pg_class') AS table_comment
-            FROM pg_class c
-            JOIN pg_namespace n ON n.oid = c.relnamespace
-            WHERE n.nspname = $1 AND c.relname = $2
-        """
-
-        # Get columns
-        columns_query = """
-            SELECT
-                a.attname AS column_name,
-                pg_catalog.format_type(a.atttypid, a.atttypmod) AS data_type,
-                NOT a.attnotnull AS is_nullable,
-                EXISTS (
-                    SELECT 1 FROM pg_constraint con
-                    WHERE con.conrelid = a.attrelid
-                      AND con.contype = 'p'
-                      AND a.attnum = ANY(con.conkey)
-                ) AS is_primary_key,
-                EXISTS (
-                    SELECT 1 FROM pg_constraint con
-                    WHERE con.conrelid = a.attrelid
-                      AND con.contype = 'f'
-                      AND a.attnum = ANY(con.conkey)
-                ) AS is_foreign_key,
-                col_description(a.attrelid, a.attnum) AS column_comment,
-                a.attnum AS ordinal_position
-            FROM pg_attribute a
-            JOIN pg_class c ON a.attrelid = c.oid
-            JOIN pg_namespace n ON c.relnamespace = n.oid
-            WHERE n.nspname = $1
-              AND c.relname = $2
-              AND a.attnum > 0
-              AND NOT a.attisdropped
-            ORDER BY a.attnum
-        """
+    async def execute_query(self, query: str) -> QueryResult:
+        """Execute SQL SELECT query and stream results in batches.
 
-        # Get indexes
-        indexes_query = """
-            SELECT
-                i.relname AS index_name,
-                ARRAY_AGG(a.attname ORDER BY a.attnum) AS columns,
-                ix.indisunique AS is_unique,
-                ix.indisprimary AS is_primary
-            FROM pg_index ix
-            JOIN pg_class t ON t.oid = ix.indrelid
-            JOIN pg_class i ON i.oid = ix.indexrelid
-            JOIN pg_namespace n ON t.relnamespace = n.oid
-            JOIN pg_attribute a ON a.attrelid = t.oid AND a.attnum = ANY(ix.indkey)
-            WHERE n.nspname = $1 AND t.relname = $2
-            GROUP BY i.relname, ix.indisunique, ix.indisprimary
+        The statement is prepared and the first batch fetched before returning, so
+        errors in the query surface here. The cursor's transaction stays open until
+        the returned batches are exhausted or closed.
         """
-
-        async for conn in self._pool.acquire():
-            # Check existence
-            exists = await conn.fetchval(exists_query, self._schema, table_name)
-            if not exists:
-                raise TableNotFoundError(
-                    f"Table '{table_name}' not found in schema '{self._schema}'"
-                )
-
-            # Get table comment
-            table_comment = await conn.fetchval(comment_query, self._schema, table_name)
-
-            # Get columns
-            column_rows = await conn.fetch(columns_query, self._schema, table_name)
-            columns = [
-                ColumnInfo(
-                    column_name=row["column_name"],
-                    data_type=row["data_type"],
-                    is_nullable=row["is_nullable"],
-                    is_primary_key=row["is_primary_key"],
-                    is_foreign_key=row["is_foreign_key"],
-                    column_comment=row["column_comment"],
-                    ordinal_position=row["ordinal_position"],
-                )
-                for row in column_rows
-            ]
-
-            # Get indexes
-            index_rows = await conn.fetch(indexes_query, self._schema, table_name)
-            indexes = [
-                IndexInfo(
-                    index_name=row["index_name"],
-                    columns=list(row["columns"]),
-                    is_unique=row["is_unique"],
-                    is_primary=row["is_primary"],
-                )
-                for row in index_rows
-            ]
-
-            return columns, indexes, table_comment
-
-    async def execute_query(self, query: str) -> QueryResult:  # type: ignore[return]
-        """Execute SQL SELECT query and return results."""
+        conn = await self._connection.get()
+        stack = AsyncExitStack()
         try:
-            async for conn in self._pool.acquire():
-                rows = await conn.fetch(query)
-
-                if not rows:
-                    return QueryResult(columns=[], rows=[], row_count=0)
-
-                columns = list(rows[0].keys())
-                data_rows = [list(row.values()) for row in rows]
-
-                return QueryResult(columns=columns, rows=data_rows, row_count=len(rows))
+            # Server-side cursors only live inside a transaction
+            await stack.enter_async_context(conn.transaction())
+            statement = await conn.prepare(query)
+            cursor = await statement.cursor()
+            first_batch = await cursor.fetch(self._batch_size)
         except asyncpg.PostgresError as e:
+            await stack.aclose()
             raise QueryExecutionError(f"Query execution failed: {str(e)}") from e
+        except BaseException:
+            await stack.aclose()
+            raise
+
+        async def batches() -> AsyncGenerator[list[tuple[Any, ...]], None]:
+            async with stack:
+                batch = first_batch
+                while batch:
+                    # tuple() copies a Record far faster than list(); orjson encodes both as arrays
+                    yield [tuple(row) for row in batch]
+                    if len(batch) < self._batch_size:
+                        break
+                    # The response is already streaming here, so errors can only abort it
+                    batch = await cursor.fetch(self._batch_size)
+
+        columns = [attribute.name for attribute in statement.get_attributes()]
+        return QueryResult(columns=columns, batches=batches())
@@ -3,9 +3,13 @@ from collections.abc import AsyncGenerator
 from contextlib import asynccontextmanager
 
 from fastapi import FastAPI
+from fastapi.middleware.gzip import GZipMiddleware
 
 from api.exception_handlers import database_error_handler
-from api.routes import query, tables
+from api.openapi import install_struct_schemas
+from api.responses import ORJSONResponse
+from api.routes import batch, query, tables
+from api.schemas.responses import BatchResponse, QueryResponse, SchemaResponse, TablesResponse
 from infrastructure.config.settings import get_settings
 from infrastructure.database.connection import get_pool
 from infrastructure.exceptions.database_exceptions import DatabaseError
@@ -39,15 +43,24 @@ app = FastAPI(
     title="SQL Query Proxy API",
     description="REST API for PostgreSQL database introspection and querying",
     version="1.0.0",
+    default_response_class=ORJSONResponse,
     lifespan=lifespan,
 )
 
+# Compress larger responses (query results are often highly repetitive);
+# level 1 keeps CPU cost well below the cost of encoding the JSON
+app.add_middleware(GZipMiddleware, minimum_size=1024, compresslevel=1)
+
 # Register exception handlers
 app.add_exception_handler(DatabaseError, database_error_handler)
 
 # Include routers
 app.include_router(tables.router)
 app.include_router(query.router)
+app.include_router(batch.router)
+
+# Document msgspec response schemas in OpenAPI
+install_struct_schemas(app, TablesResponse, SchemaResponse, QueryResponse, BatchResponse)
 
 
 @app.get("/", tags=["health"])
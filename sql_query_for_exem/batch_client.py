@@ -0,0 +1,94 @@
+"""Coalesces concurrent catalog requests into POST /api/batch calls."""
+
+from __future__ import annotations
+
+import asyncio
+from typing import Any
+
+import httpx
+import orjson
+
+from .http_client import get_client
+
+_BATCH_PATH = "/api/batch"
+
+# Matches the operation limit of POST /api/batch
+_MAX_BATCH_SIZE = 100
+
+_Pending = tuple[dict[str, Any], asyncio.Future[httpx.Response]]
+
+_pending: dict[asyncio.AbstractEventLoop, list[_Pending]] = {}
+_flush_tasks: set[asyncio.Task[None]] = set()
+
+
+async def catalog_request(operation: dict[str, Any]) -> httpx.Response:
+    """Send a catalog operation, sharing one HTTP request with concurrent calls.
+
+    Operations submitted during the same event loop iteration (e.g. tools run
+    with asyncio.gather, or prefetch_schemas) are sent together in one batch,
+    so N lookups cost a single round trip. A lone call is flushed on the next
+    iteration, without waiting for a batching window.
+
+    Args:
+        operation: Batch operation, e.g. {"op": "schema", "table_name": "users"}
+
+    Returns:
+        Response with the status and body the standalone endpoint would return
+
+    Raises:
+        httpx.HTTPStatusError: If the batch request itself was rejected
+        httpx.RequestError: If the API could not be reached
+    """
+    loop = asyncio.get_running_loop()
+    future: asyncio.Future[httpx.Response] = loop.create_future()
+    pending = _pending.get(loop)
+    if pending is None:
+        pending = _pending[loop] = []
+        loop.call_soon(_flush, loop)
+    pending.append((operation, future))
+    return await future
+
+
+def _flush(loop: asyncio.AbstractEventLoop) -> None:
+    """Send everything queued on the loop, split into batches the API accepts."""
+    pending = _pending.pop(loop)
+    for start in range(0, len(pending), _MAX_BATCH_SIZE):
+        task = loop.create_task(_send_batch(pending[start : start + _MAX_BATCH_SIZE]))
+        # Keep a reference so the task isn't garbage collected mid-flight
+        _flush_tasks.add(task)
+        task.add_done_callback(_flush_tasks.discard)
+
+
+async def _send_batch(batch: list[_Pending]) -> None:
+    """POST one batch and resolve each caller's future with its own result."""
+    try:
+        response = await get_client().post(
+            _BATCH_PATH,
+            content=orjson.dumps({"operations": [operation for operation, _ in batch]}),
+            headers={"Content-Type": "application/json"},
+        )
+        response.raise_for_status()
+        results = orjson.loads(response.content)["results"]
+        # Build every response before resolving any, so a malformed result
+        # fails the whole batch instead of leaving some callers waiting
+        responses = [
+            httpx.Response(
+                result["status"],
+                content=orjson.dumps(result["body"]),
+                request=response.request,
+            )
+            for _, result in zip(batch, results, strict=True)
+        ]
+    except asyncio.CancelledError:
+        for _, future in batch:
+            future.cancel()
+        raise
+    except Exception as e:
+        for _, future in batch:
+            if not future.done():
+                future.set_exception(e)
+        return
+
+    for (_, future), item_response in zip(batch, responses, strict=True):
+        if not future.done():
+            future.set_result(item_response)
@@ -0,0 +1,58 @@
+"""Shared HTTP client for the SQL API tools."""
+
+from __future__ import annotations
+
+import asyncio
+import importlib.util
+import os
+
+import httpx
+
+# API URL configurable via environment variable (for Docker)
+SQL_API_BASE_URL = os.environ.get("SQL_API_URL", "http://localhost:18790")
+
+# HTTP/2 needs the optional h2 package (httpx[http2]); httpx negotiates it over
+# TLS and falls back to HTTP/1.1 otherwise
+_HTTP2_AVAILABLE = importlib.util.find_spec("h2") is not None
+
+# One client per event loop: connections belong to the loop they were opened on
+_clients: dict[asyncio.AbstractEventLoop, httpx.AsyncClient] = {}
+
+
+def get_client() -> httpx.AsyncClient:
+    """Get the client for the SQL API shared by calls on the running event loop.
+
+    Reusing one client keeps connections alive between tool calls instead of
+    opening a new one per call, and with HTTP/2 concurrent calls share a single
+    connection. Responses are gzip-compressed by the API (httpx advertises
+    gzip by default, and brotli when the brotli package is installed). A new
+    client is created if the previous one was closed.
+    """
+    loop = asyncio.get_running_loop()
+    client = _clients.get(loop)
+    if client is None or client.is_closed:
+        _forget_closed_loops()
+        client = _clients[loop] = httpx.AsyncClient(
+            base_url=SQL_API_BASE_URL,
+            timeout=30.0,
+            limits=httpx.Limits(max_keepalive_connections=20, max_connections=50),
+            http2=_HTTP2_AVAILABLE,
+        )
+    return client
+
+
+async def close_client() -> None:
+    """Close the running event loop's client (call on agent shutdown)."""
+    client = _clients.pop(asyncio.get_running_loop(), None)
+    if client is not None:
+        await client.aclose()
+
+
+def _forget_closed_loops() -> None:
+    """Drop clients whose event loop was closed without calling close_client().
+
+    Their connections can't be closed from another loop, so they are left to be
+    released with the client.
+    """
+    for loop in [loop for loop in _clients if loop.is_closed()]:
+        del _clients[loop]
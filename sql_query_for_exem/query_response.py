@@ -0,0 +1,100 @@
+"""Reads query API responses, parsing only the start of oversized ones."""
+
+from __future__ import annotations
+
+import json
+import re
+from typing import Any
+
+import httpx
+import orjson
+
+# Larger responses are not read to the end: only the rows received up to this
+# size are parsed and the stream is closed, which also stops the query server-side
+MAX_RESPONSE_BYTES = 2 * 1024 * 1024
+
+_JSON_DECODER = json.JSONDecoder()
+_JSON_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+
+async def read_query_result(response: httpx.Response, max_rows: int) -> tuple[dict[str, Any], bool]:
+    """Read a query API response, stopping once it exceeds MAX_RESPONSE_BYTES.
+
+    Args:
+        response: Streamed response of the query endpoint
+        max_rows: Rows needed from a cut-off response
+
+    Returns:
+        Tuple of (parsed result, whether the body was cut off). A cut-off result
+        holds at most `max_rows` complete rows and no reliable row_count.
+    """
+    body = bytearray()
+    async for chunk in response.aiter_bytes():
+        body += chunk
+        if len(body) > MAX_RESPONSE_BYTES:
+            text = body.decode("utf-8", errors="ignore")
+            return parse_partial_result(text, max_rows), True
+    return orjson.loads(body), False
+
+
+def parse_partial_result(text: str, max_rows: int) -> dict[str, Any]:
+    """Parse the complete leading members of a cut-off JSON object.
+
+    Rows are decoded one at a time, so every row that arrived in full is kept;
+    parsing stops at the first incomplete value or after `max_rows` rows.
+    """
+    result: dict[str, Any] = {}
+    pos = _skip_whitespace(text, 0)
+    if not text.startswith("{", pos):
+        raise ValueError("Query response is not a JSON object")
+    pos += 1
+
+    while True:
+        pos = _skip_whitespace(text, pos)
+        if not text.startswith('"', pos):
+            return result
+        try:
+            key, pos = _JSON_DECODER.raw_decode(text, pos)
+            pos = _skip_whitespace(text, pos) + 1  # ':'
+            pos = _skip_whitespace(text, pos)
+            if key == "rows":
+                rows: list[Any] = []
+                result["rows"] = rows
+                pos = _parse_partial_rows(text, pos, rows, max_rows)
+            else:
+                result[key], pos = _JSON_DECODER.raw_decode(text, pos)
+        except json.JSONDecodeError:
+            return result
+        pos = _skip_whitespace(text, pos)
+        if not text.startswith(",", pos):
+            return result
+        pos += 1
+
+
+def _parse_partial_rows(text: str, pos: int, rows: list[Any], max_rows: int) -> int:
+    """Decode rows of the array starting at `pos` into `rows`.
+
+    Returns:
+        Position after the array
+
+    Raises:
+        json.JSONDecodeError: If the array is incomplete or `max_rows` is reached
+    """
+    pos += 1  # '['
+    while True:
+        pos = _skip_whitespace(text, pos)
+        if text.startswith("]", pos):
+            return pos + 1
+        if len(rows) >= max_rows:
+            raise json.JSONDecodeError("Row limit reached", text, pos)
+        row, pos = _JSON_DECODER.raw_decode(text, pos)
+        rows.append(row)
+        pos = _skip_whitespace(text, pos)
+        if text.startswith(",", pos):
+            pos += 1
+
+
+def _skip_whitespace(text: str, pos: int) -> int:
+    """Return the position of the next non-whitespace character."""
+    match = _JSON_WHITESPACE.match(text, pos)
+    return match.end() if match else pos
@@ -0,0 +1,41 @@
+"""In-process TTL cache for formatted tool results."""
+
+from __future__ import annotations
+
+import time
+
+
+class ResultCache:
+    """Maps keys to formatted results for a limited time.
+
+    Entries expire `ttl` seconds after they are stored; once `maxsize` entries
+    are held, the oldest one is evicted. Tools run on a single event loop, so no
+    locking is needed.
+    """
+
+    def __init__(self, maxsize: int, ttl: float) -> None:
+        self._maxsize = maxsize
+        self._ttl = ttl
+        self._entries: dict[str, tuple[float, str]] = {}
+
+    def get(self, key: str) -> str | None:
+        """Return the cached result, or None if missing or expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: str) -> None:
+        """Store a result, evicting the oldest entry when full."""
+        self._entries.pop(key, None)
+        if len(self._entries) >= self._maxsize:
+            del self._entries[next(iter(self._entries))]
+        self._entries[key] = (time.monotonic() + self._ttl, value)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
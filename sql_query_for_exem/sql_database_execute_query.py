@@ -4,15 +4,17 @@ from __future__ import annotations
 
 import json
 import logging
-import os
+import re
 from typing import TYPE_CHECKING
 
 import httpx
+import orjson
 from pydantic import Field
 from sgr_agent_core.base_tool import BaseTool
 
-# API URL configurable via environment variable (for Docker)
-SQL_API_BASE_URL = os.environ.get("SQL_API_URL", "http://localhost:18790")
+from .http_client import SQL_API_BASE_URL, get_client
+from .query_response import MAX_RESPONSE_BYTES, read_query_result
+from .result_cache import ResultCache
 
 if TYPE_CHECKING:
     from sgr_agent_core.agent_definition import AgentConfig
@@ -20,6 +22,43 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+_QUERY_PATH = "/api/query"
+
+# Agents often repeat the same query within a few turns; successful results are
+# reused briefly, keyed by the query with insignificant whitespace collapsed
+_QUERY_CACHE = ResultCache(maxsize=256, ttl=30.0)
+
+# Quoted literals and identifiers are kept verbatim, other whitespace runs collapse
+_WHITESPACE_PATTERN = re.compile(r"('(?:[^']|'')*'|\"(?:[^\"]|\"\")*\")|\s+")
+
+# Queries whose result depends on when or how often they run are never cached
+_VOLATILE_PATTERN = re.compile(
+    r"\b(?:now|current_(?:date|time|timestamp)|localtime(?:stamp)?|clock_timestamp"
+    r"|statement_timestamp|transaction_timestamp|timeofday|random|gen_random_uuid"
+    r"|nextval|setval|currval|lastval)\b",
+    re.IGNORECASE,
+)
+
+
+# Hints for common execution errors, keyed by a phrase from the error message
+_ERROR_HINTS = {
+    "does not exist": (
+        "Table or column doesn't exist. "
+        "Use SQLDatabaseGetTablesTool and SQLTableGetSchemaTool to verify."
+    ),
+    "syntax error": "SQL syntax error. Check query syntax.",
+    "permission denied": "Insufficient permissions to execute query.",
+}
+_ERROR_HINT_PATTERN = re.compile("|".join(map(re.escape, _ERROR_HINTS)), re.IGNORECASE)
+
+
+def _query_cache_key(sql_query: str, max_rows: int) -> str | None:
+    """Build the result cache key for a query, or None if it must not be cached."""
+    if _VOLATILE_PATTERN.search(sql_query):
+        return None
+    normalized = _WHITESPACE_PATTERN.sub(lambda m: m.group(1) or " ", sql_query).strip()
+    return f"{max_rows}:{normalized}"
+
 
 class SQLDatabaseExecuteQueryTool(BaseTool):
     """Execute SQL SELECT queries against PostgreSQL and return results.
@@ -53,7 +92,13 @@ class SQLDatabaseExecuteQueryTool(BaseTool):
     )
     expected_columns: list[str] = Field(
         description="List of expected columns in result (for query validation)",
-        default=[],
+        default_factory=list,
+    )
+    max_rows_returned: int = Field(
+        description="Maximum number of rows included in the result (the rest is dropped)",
+        default=500,
+        ge=1,
+        le=10000,
     )
 
     async def __call__(self, context: AgentContext, config: AgentConfig, **_) -> str:
@@ -66,69 +111,106 @@ class SQLDatabaseExecuteQueryTool(BaseTool):
         Returns:
             JSON string with query results
         """
-        api_url = f"{SQL_API_BASE_URL}/api/query"
-
         logger.info("🔍 Executing SQL query")
-        logger.debug(f"Reasoning: {self.reasoning}")
-        logger.debug(f"Query: {self.sql_query}")
+        logger.debug("Reasoning: %s", self.reasoning)
+        logger.debug("Query: %s", self.sql_query)
+
+        cache_key = _query_cache_key(self.sql_query, self.max_rows_returned)
+        if cache_key is not None:
+            cached = _QUERY_CACHE.get(cache_key)
+            if cached is not None:
+                logger.info("✅ Query result served from cache")
+                return cached
 
         try:
-            async with httpx.AsyncClient(timeout=60.0) as client:
-                response = await client.post(
-                    api_url,
-                    json={"query": self.sql_query},
-                    headers={"Content-Type": "application/json"},
-                )
+            client = get_client()
+            async with client.stream(
+                "POST",
+                _QUERY_PATH,
+                json={"query": self.sql_query},
+                headers={"Content-Type": "application/json"},
+                timeout=60.0,
+            ) as response:
+                if response.is_error:
+                    # Error details are read from the body by the handlers below
+                    await response.aread()
                 response.raise_for_status()
 
-                result = response.json()
-
-                # Validate expected columns if specified
-                if self.expected_columns:
-                    actual_columns = set(result.get("columns", []))
-                    expected_columns = set(self.expected_columns)
-
-                    if not expected_columns.issubset(actual_columns):
-                        missing = expected_columns - actual_columns
-                        logger.warning(f"⚠️ Some expected columns are missing: {missing}")
-
-                # Add summary for convenience
-                summary = {
-                    "row_count": result["row_count"],
-                    "column_count": len(result["columns"]),
-                    "columns": result["columns"],
-                    "has_data": result["row_count"] > 0,
-                }
-
-                # Warn if too much data
-                if result["row_count"] > 100:
-                    summary["warning"] = (
-                        f"Returned {result['row_count']} rows. "
-                        "Consider using LIMIT to restrict results."
-                    )
-
-                formatted_result = {
-                    "summary": summary,
-                    "data": {
-                        "columns": result["columns"],
-                        "rows": result["rows"],
-                    },
-                    "query_executed": result.get("query", self.sql_query),
-                }
+                result, cut_off = await read_query_result(response, self.max_rows_returned)
+
+            columns = result["columns"]
+            rows = result["rows"]
+            # The total is sent last, so it's unknown for a cut-off response
+            row_count = None if cut_off else result["row_count"]
+            received_rows = len(rows)
+            column_count = len(columns)
+
+            # Validate expected columns if specified
+            if self.expected_columns:
+                actual_columns = set(columns)
+                expected_columns = set(self.expected_columns)
+
+                if not expected_columns.issubset(actual_columns):
+                    missing = expected_columns - actual_columns
+                    logger.warning("⚠️ Some expected columns are missing: %s", missing)
+
+            # Add summary for convenience
+            summary = {
+                "row_count": row_count,
+                "column_count": column_count,
+                "columns": columns,
+                "has_data": received_rows > 0,
+            }
+
+            # Only the first rows are passed on; the agent rarely reads more
+            truncated = cut_off or len(rows) > self.max_rows_returned
+            if truncated:
+                rows = rows[: self.max_rows_returned]
+
+            # Warn if too much data
+            if cut_off:
+                summary["warning"] = (
+                    f"Result exceeds {MAX_RESPONSE_BYTES // (1024 * 1024)} MiB and was not read "
+                    f"to the end (total row count unknown), only the first {len(rows)} rows "
+                    "are included. Consider using LIMIT to restrict results."
+                )
+            elif truncated:
+                summary["warning"] = (
+                    f"Returned {received_rows} rows, only the first "
+                    f"{self.max_rows_returned} are included. "
+                    "Consider using LIMIT to restrict results."
+                )
+            elif received_rows > 100:
+                summary["warning"] = (
+                    f"Returned {received_rows} rows. Consider using LIMIT to restrict results."
+                )
+
+            formatted_result = {
+                "summary": summary,
+                "data": {
+                    "columns": columns,
+                    "rows": rows,
+                    "truncated": truncated,
+                },
+                "query_executed": result.get("query", self.sql_query),
+            }
+
+            logger.info(
+                "✅ Query executed successfully: %d rows, %d columns", received_rows, column_count
+            )
 
-                logger.info(
-                    f"✅ Query executed successfully: {result['row_count']} rows, "
-                    f"{len(result['columns'])} columns"
+            # Add hint if no data
+            if received_rows == 0:
+                formatted_result["hint"] = (
+                    "Query executed successfully but returned no data. "
+                    "Check WHERE conditions or try different query."
                 )
 
-                # Add hint if no data
-                if result["row_count"] == 0:
-                    formatted_result["hint"] = (
-                        "Query executed successfully but returned no data. "
-                        "Check WHERE conditions or try different query."
-                    )
+            formatted = orjson.dumps(formatted_result).decode()
+            if cache_key is not None:
+                _QUERY_CACHE.set(cache_key, formatted)
 
-                return json.dumps(formatted_result, ensure_ascii=False, indent=2)
+            return formatted
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 400:
@@ -160,13 +242,8 @@ class SQLDatabaseExecuteQueryTool(BaseTool):
                 logger.error(error_msg)
 
                 # Try to provide helpful hints
-                hints = []
-                if "does not exist" in error_detail.lower():
-                    hints.append("Table or column doesn't exist. Use SQLDatabaseGetTablesTool and SQLTableGetSchemaTool to verify.")
-                if "syntax error" in error_detail.lower():
-                    hints.append("SQL syntax error. Check query syntax.")
-                if "permission denied" in error_detail.lower():
-                    hints.append("Insufficient permissions to execute query.")
+                found = {match.lower() for match in _ERROR_HINT_PATTERN.findall(error_detail)}
+                hints = [hint for phrase, hint in _ERROR_HINTS.items() if phrase in found]
 
                 return json.dumps(
                     {
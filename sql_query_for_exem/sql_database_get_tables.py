@@ -4,15 +4,15 @@ from __future__ import annotations
 
 import json
 import logging
-import os
 from typing import TYPE_CHECKING
 
 import httpx
+import orjson
 from pydantic import Field
 from sgr_agent_core.base_tool import BaseTool
 
-# API URL configurable via environment variable (for Docker)
-SQL_API_BASE_URL = os.environ.get("SQL_API_URL", "http://localhost:18790")
+from .batch_client import catalog_request
+from .http_client import SQL_API_BASE_URL
 
 if TYPE_CHECKING:
     from sgr_agent_core.agent_definition import AgentConfig
@@ -64,34 +64,34 @@ class SQLDatabaseGetTablesTool(BaseTool):
         Returns:
             JSON string with tables list and pagination info
         """
-        api_url = f"{SQL_API_BASE_URL}/api/tables"
-
-        logger.info(f"📊 Getting tables list: page={self.page}, page_size={self.page_size}")
-        logger.debug(f"Reasoning: {self.reasoning}")
+        logger.info("📊 Getting tables list: page=%d, page_size=%d", self.page, self.page_size)
+        logger.debug("Reasoning: %s", self.reasoning)
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(
-                    api_url,
-                    params={"page": self.page, "page_size": self.page_size},
-                )
-                response.raise_for_status()
-
-                result = response.json()
-
-                # Format result for better readability
-                formatted_result = {
-                    "tables": result["tables"],
-                    "pagination": result["pagination"],
-                    "summary": {
-                        "total_tables": result["pagination"]["total_count"],
-                        "showing": f"{len(result['tables'])} tables on page {self.page} of {result['pagination']['total_pages']}",
-                    }
-                }
-
-                logger.info(f"✅ Retrieved {len(result['tables'])} of {result['pagination']['total_count']} tables")
-
-                return json.dumps(formatted_result, ensure_ascii=False, indent=2)
+            response = await catalog_request(
+                {"op": "tables", "page": self.page, "page_size": self.page_size}
+            )
+            response.raise_for_status()
+
+            result = orjson.loads(response.content)
+
+            tables = result["tables"]
+            pagination = result["pagination"]
+            total_count = pagination["total_count"]
+
+            # Format result for better readability
+            formatted_result = {
+                "tables": tables,
+                "pagination": pagination,
+                "summary": {
+                    "total_tables": total_count,
+                    "showing": f"{len(tables)} tables on page {self.page} of {pagination['total_pages']}",
+                },
+            }
+
+            logger.info("✅ Retrieved %d of %d tables", len(tables), total_count)
+
+            return orjson.dumps(formatted_result).decode()
 
         except httpx.HTTPStatusError as e:
             error_msg = f"HTTP error retrieving tables: {e.response.status_code}"
@@ -2,17 +2,21 @@
 
 from __future__ import annotations
 
+import asyncio
 import json
 import logging
-import os
-from typing import TYPE_CHECKING
+from collections import defaultdict
+from collections.abc import Iterable
+from typing import TYPE_CHECKING, Any
 
 import httpx
+import orjson
 from pydantic import Field
 from sgr_agent_core.base_tool import BaseTool
 
-# API URL configurable via environment variable (for Docker)
-SQL_API_BASE_URL = os.environ.get("SQL_API_URL", "http://localhost:18790")
+from .batch_client import catalog_request
+from .http_client import SQL_API_BASE_URL
+from .result_cache import ResultCache
 
 if TYPE_CHECKING:
     from sgr_agent_core.agent_definition import AgentConfig
@@ -20,6 +24,10 @@ if TYPE_CHECKING:
 
 logger = logging.getLogger(__name__)
 
+# Table schemas change rarely; repeated lookups within an agent session
+# are answered from memory instead of the API
+_SCHEMA_CACHE = ResultCache(maxsize=256, ttl=300.0)
+
 
 class SQLTableGetSchemaTool(BaseTool):
     """Get detailed schema of specified PostgreSQL table.
@@ -58,48 +66,31 @@ class SQLTableGetSchemaTool(BaseTool):
         Returns:
             JSON string with detailed table schema
         """
-        api_url = f"{SQL_API_BASE_URL}/api/tables/{self.table_name}/schema"
+        logger.info("🔍 Getting schema for table: %s", self.table_name)
+        logger.debug("Reasoning: %s", self.reasoning)
 
-        logger.info(f"🔍 Getting schema for table: {self.table_name}")
-        logger.debug(f"Reasoning: {self.reasoning}")
+        cached = _SCHEMA_CACHE.get(self.table_name)
+        if cached is not None:
+            logger.info("✅ Schema for '%s' served from cache", self.table_name)
+            return cached
 
         try:
-            async with httpx.AsyncClient(timeout=30.0) as client:
-                response = await client.get(api_url)
-                response.raise_for_status()
-
-                result = response.json()
-
-                # Add summary for convenience
-                summary = {
-                    "table_name": result["table_name"],
-                    "table_comment": result.get("table_comment"),
-                    "total_columns": result["column_count"],
-                    "has_primary_key": any(col.get("is_primary_key") for col in result["columns"]),
-                    "has_foreign_keys": any(col.get("is_foreign_key") for col in result["columns"]),
-                    "indexes_count": len(result["indexes"]),
-                }
-
-                # Group columns by type for better understanding
-                columns_by_type = {}
-                for col in result["columns"]:
-                    data_type = col["data_type"]
-                    if data_type not in columns_by_type:
-                        columns_by_type[data_type] = []
-                    columns_by_type[data_type].append(col["column_name"])
-
-                formatted_result = {
-                    "summary": summary,
-                    "columns_by_type": columns_by_type,
-                    "full_schema": result,
-                }
-
-                logger.info(
-                    f"✅ Retrieved schema for '{self.table_name}': "
-                    f"{result['column_count']} columns, {len(result['indexes'])} indexes"
-                )
+            response = await catalog_request(_schema_operation(self.table_name))
+            response.raise_for_status()
+
+            result = orjson.loads(response.content)
+
+            formatted = _format_schema(result)
+            _SCHEMA_CACHE.set(self.table_name, formatted)
+
+            logger.info(
+                "✅ Retrieved schema for '%s': %d columns, %d indexes",
+                self.table_name,
+                result["column_count"],
+                len(result["indexes"]),
+            )
 
-                return json.dumps(formatted_result, ensure_ascii=False, indent=2)
+            return formatted
 
         except httpx.HTTPStatusError as e:
             if e.response.status_code == 404:
@@ -127,3 +118,88 @@ class SQLTableGetSchemaTool(BaseTool):
             error_msg = f"Unexpected error retrieving table schema: {str(e)}"
             logger.error(error_msg)
             return json.dumps({"error": error_msg}, ensure_ascii=False)
+
+
+def _schema_operation(table_name: str) -> dict[str, Any]:
+    """Build the batch operation fetching a table's schema."""
+    return {"op": "schema", "table_name": table_name}
+
+
+def _format_schema(result: dict[str, Any]) -> str:
+    """Format a schema API response into the tool's JSON output."""
+    # Key flags and type groups are collected in a single pass over the columns
+    has_primary_key = False
+    has_foreign_keys = False
+    columns_by_type: defaultdict[str, list[str]] = defaultdict(list)
+    for col in result["columns"]:
+        if col.get("is_primary_key"):
+            has_primary_key = True
+        if col.get("is_foreign_key"):
+            has_foreign_keys = True
+        columns_by_type[col["data_type"]].append(col["column_name"])
+
+    # Add summary for convenience
+    summary = {
+        "table_name": result["table_name"],
+        "table_comment": result.get("table_comment"),
+        "total_columns": result["column_count"],
+        "has_primary_key": has_primary_key,
+        "has_foreign_keys": has_foreign_keys,
+        "indexes_count": len(result["indexes"]),
+    }
+
+    formatted_result = {
+        "summary": summary,
+        "columns_by_type": columns_by_type,
+        "full_schema": result,
+    }
+
+    return orjson.dumps(formatted_result).decode()
+
+
+async def prefetch_schemas(table_names: Iterable[str]) -> dict[str, str]:
+    """Fetch several table schemas in one batch request and cache them.
+
+    Meant for the agent's planning phase: once candidate tables are known from
+    SQLDatabaseGetTablesTool, later SQLTableGetSchemaTool calls for them are
+    answered from cache. Tables that can't be fetched are skipped.
+
+    Args:
+        table_names: Names of tables to prefetch
+
+    Returns:
+        Formatted schema JSON by table name, for every table now in cache
+    """
+    schemas: dict[str, str] = {}
+    missing: list[str] = []
+    for table_name in dict.fromkeys(table_names):
+        cached = _SCHEMA_CACHE.get(table_name)
+        if cached is not None:
+            schemas[table_name] = cached
+        else:
+            missing.append(table_name)
+
+    if not missing:
+        return schemas
+
+    requested = len(schemas) + len(missing)
+    responses = await asyncio.gather(
+        *(catalog_request(_schema_operation(table_name)) for table_name in missing),
+        return_exceptions=True,
+    )
+
+    for table_name, response in zip(missing, responses, strict=True):
+        if isinstance(response, BaseException):
+            logger.warning("⚠️ Failed to prefetch schema for '%s': %s", table_name, response)
+            continue
+        if response.status_code != 200:
+            logger.warning(
+                "⚠️ Failed to prefetch schema for '%s': HTTP %d", table_name, response.status_code
+            )
+            continue
+        formatted = _format_schema(orjson.loads(response.content))
+        _SCHEMA_CACHE.set(table_name, formatted)
+        schemas[table_name] = formatted
+
+    logger.info("✅ Prefetched schemas for %d of %d tables", len(schemas), requested)
+    return schemas
@@ -0,0 +1,143 @@
+from collections.abc import AsyncIterator, Iterator
+
+import orjson
+import pytest
+from fastapi.testclient import TestClient
+
+from api.dependencies import get_connection, get_repository, get_schema_cache, get_tables_cache
+from domain.entities.pagination import Pagination
+from domain.entities.table_info import TableInfo
+from infrastructure.cache.ttl_cache import AsyncTTLCache
+from infrastructure.exceptions.database_exceptions import TableNotFoundError
+from main import app
+
+TABLES = [
+    TableInfo("users", "BASE TABLE", "16 kB", 3, "Users"),
+    TableInfo("orders", "BASE TABLE", None, 5, None),
+]
+SCHEMAS = {
+    "users": orjson.dumps({"table_name": "users", "column_count": 0, "columns": [], "indexes": []})
+}
+
+
+class FakeRepository:
+    """In-memory catalog standing in for PostgreSQLRepository."""
+
+    async def get_tables(self, pagination: Pagination) -> tuple[list[TableInfo], int]:
+        offset = pagination.offset
+        return TABLES[offset : offset + pagination.page_size], len(TABLES)
+
+    async def get_table_schema(self, table_name: str) -> str:
+        if table_name not in SCHEMAS:
+            raise TableNotFoundError(f"Table '{table_name}' not found in schema 'public'")
+        return SCHEMAS[table_name].decode()
+
+
+class FakeConnection:
+    """Request connection that only counts releases."""
+
+    def __init__(self) -> None:
+        self.releases = 0
+
+    async def release(self) -> None:
+        self.releases += 1
+
+
+@pytest.fixture
+def connection() -> FakeConnection:
+    return FakeConnection()
+
+
+@pytest.fixture
+def client(connection: FakeConnection) -> Iterator[TestClient]:
+    async def override_connection() -> AsyncIterator[FakeConnection]:
+        yield connection
+
+    app.dependency_overrides[get_repository] = FakeRepository
+    app.dependency_overrides[get_connection] = override_connection
+    app.dependency_overrides[get_tables_cache] = lambda: AsyncTTLCache(maxsize=10, ttl=60)
+    app.dependency_overrides[get_schema_cache] = lambda: AsyncTTLCache(maxsize=10, ttl=60)
+    # Not used as a context manager, so the lifespan doesn't open a database pool
+    yield TestClient(app)
+    app.dependency_overrides.clear()
+
+
+def test_results_follow_operation_order(client: TestClient) -> None:
+    response = client.post(
+        "/api/batch",
+        json={
+            "operations": [
+                {"op": "schema", "table_name": "users"},
+                {"op": "tables", "page": 1, "page_size": 1},
+                {"op": "tables", "page": 2, "page_size": 1},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    results = response.json()["results"]
+    assert [r["status"] for r in results] == [200, 200, 200]
+    assert results[0]["body"] == orjson.loads(SCHEMAS["users"])
+    assert results[1]["body"] == {
+        "tables": [
+            {
+                "table_name": "users",
+                "table_type": "BASE TABLE",
+                "table_size": "16 kB",
+                "column_count": 3,
+                "table_comment": "Users",
+            }
+        ],
+        "pagination": {"page": 1, "page_size": 1, "total_count": 2, "total_pages": 2},
+    }
+    assert results[2]["body"]["tables"] == [
+        {"table_name": "orders", "table_type": "BASE TABLE", "column_count": 5}
+    ]
+
+
+def test_missing_table_is_reported_per_operation(client: TestClient) -> None:
+    response = client.post(
+        "/api/batch",
+        json={
+            "operations": [
+                {"op": "schema", "table_name": "missing"},
+                {"op": "schema", "table_name": "users"},
+            ]
+        },
+    )
+
+    assert response.status_code == 200
+    missing, users = response.json()["results"]
+    assert missing == {
+        "status": 404,
+        "body": {"detail": "Table 'missing' not found in schema 'public'"},
+    }
+    assert users["status"] == 200
+    assert users["body"]["table_name"] == "users"
+
+
+def test_connection_is_released_after_each_operation(
+    client: TestClient, connection: FakeConnection
+) -> None:
+    operations = [{"op": "schema", "table_name": name} for name in ("users", "missing", "users")]
+
+    response = client.post("/api/batch", json={"operations": operations})
+
+    assert response.status_code == 200
+    assert connection.releases == len(operations)
+
+
+@pytest.mark.parametrize(
+    "operations",
+    [
+        [],
+        [{"op": "drop"}],
+        [{"op": "schema"}],
+        [{"op": "tables", "page_size": 101}],
+        [{"op": "tables"}] * 101,
+    ],
+)
+def test_invalid_batches_are_rejected(client: TestClient, operations: list[object]) -> None:
+    response = client.post("/api/batch", json={"operations": operations})
+
+    assert response.status_code == 422
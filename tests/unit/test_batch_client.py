@@ -0,0 +1,111 @@
+import asyncio
+from collections.abc import Callable
+from typing import Any
+
+import httpx
+import orjson
+import pytest
+
+from sql_query_for_exem import batch_client
+
+Handler = Callable[[httpx.Request], httpx.Response]
+
+
+@pytest.fixture
+def mock_api(monkeypatch: pytest.MonkeyPatch) -> Callable[[Handler], list[Any]]:
+    """Route the batch client to a mock API; returns the batches it received."""
+
+    def install(handler: Handler) -> list[Any]:
+        received: list[Any] = []
+
+        def record(request: httpx.Request) -> httpx.Response:
+            received.append(orjson.loads(request.content)["operations"])
+            return handler(request)
+
+        client = httpx.AsyncClient(base_url="http://api", transport=httpx.MockTransport(record))
+        monkeypatch.setattr(batch_client, "get_client", lambda: client)
+        return received
+
+    return install
+
+
+def echo(request: httpx.Request) -> httpx.Response:
+    """Answer each operation with its own table name, 404 for 'missing'."""
+    results = [
+        {"status": 404, "body": {"detail": "not found"}}
+        if operation["table_name"] == "missing"
+        else {"status": 200, "body": {"table_name": operation["table_name"]}}
+        for operation in orjson.loads(request.content)["operations"]
+    ]
+    return httpx.Response(200, json={"results": results})
+
+
+def schema(table_name: str) -> dict[str, str]:
+    return {"op": "schema", "table_name": table_name}
+
+
+async def test_concurrent_calls_share_one_request(
+    mock_api: Callable[[Handler], list[Any]],
+) -> None:
+    received = mock_api(echo)
+
+    responses = await asyncio.gather(
+        *(batch_client.catalog_request(schema(name)) for name in ("a", "missing", "b"))
+    )
+
+    assert received == [[schema("a"), schema("missing"), schema("b")]]
+    assert [r.status_code for r in responses] == [200, 404, 200]
+    assert orjson.loads(responses[0].content) == {"table_name": "a"}
+    assert orjson.loads(responses[2].content) == {"table_name": "b"}
+    with pytest.raises(httpx.HTTPStatusError):
+        responses[1].raise_for_status()
+
+
+async def test_sequential_calls_are_sent_separately(
+    mock_api: Callable[[Handler], list[Any]],
+) -> None:
+    received = mock_api(echo)
+
+    await batch_client.catalog_request(schema("a"))
+    await batch_client.catalog_request(schema("b"))
+
+    assert received == [[schema("a")], [schema("b")]]
+
+
+async def test_rejected_batch_fails_every_call(
+    mock_api: Callable[[Handler], list[Any]],
+) -> None:
+    mock_api(lambda request: httpx.Response(500, json={"detail": "boom"}))
+
+    results = await asyncio.gather(
+        batch_client.catalog_request(schema("a")),
+        batch_client.catalog_request(schema("b")),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, httpx.HTTPStatusError) for result in results)
+
+
+@pytest.mark.parametrize(
+    "results",
+    [
+        [{"status": 200, "body": {}}],
+        [{"status": 200, "body": {}}, {"body": {}}],
+    ],
+    ids=["too-few-results", "missing-status"],
+)
+async def test_malformed_batch_fails_every_call(
+    mock_api: Callable[[Handler], list[Any]], results: list[Any]
+) -> None:
+    mock_api(lambda request: httpx.Response(200, json={"results": results}))
+
+    outcome = await asyncio.wait_for(
+        asyncio.gather(
+            batch_client.catalog_request(schema("a")),
+            batch_client.catalog_request(schema("b")),
+            return_exceptions=True,
+        ),
+        timeout=1,
+    )
+
+    assert all(isinstance(result, Exception) for result in outcome)
@@ -0,0 +1,48 @@
+import asyncio
+import threading
+
+import httpx
+
+from sql_query_for_exem import http_client
+
+
+async def test_client_is_reused_on_the_same_loop() -> None:
+    client = http_client.get_client()
+
+    assert http_client.get_client() is client
+
+    await http_client.close_client()
+    assert client.is_closed
+    assert http_client.get_client() is not client
+    await http_client.close_client()
+
+
+async def test_each_loop_keeps_its_own_client() -> None:
+    client = http_client.get_client()
+    other: list[httpx.AsyncClient] = []
+
+    async def use_client() -> None:
+        other.append(http_client.get_client())
+        await http_client.close_client()
+
+    thread = threading.Thread(target=asyncio.run, args=(use_client(),))
+    thread.start()
+    thread.join()
+
+    # The other loop's client neither replaced nor closed this one
+    assert other[0] is not client
+    assert http_client.get_client() is client
+    assert not client.is_closed
+    await http_client.close_client()
+
+
+def test_clients_of_closed_loops_are_dropped() -> None:
+    async def get_client() -> httpx.AsyncClient:
+        return http_client.get_client()
+
+    stale = asyncio.run(get_client())
+    fresh = asyncio.run(get_client())
+
+    assert fresh is not stale
+    assert list(http_client._clients.values()) == [fresh]
+    http_client._clients.clear()
@@ -0,0 +1,80 @@
+from collections.abc import AsyncIterator
+
+import httpx
+import orjson
+import pytest
+
+from sql_query_for_exem import query_response
+from sql_query_for_exem.query_response import parse_partial_result, read_query_result
+
+COLUMNS = ["id", "name"]
+ROWS = [[1, "a"], [2, "b, [c]"], [3, 'quote " and \\ backslash'], [4, None]]
+DOCUMENT = orjson.dumps({"columns": COLUMNS, "rows": ROWS, "row_count": len(ROWS)}).decode()
+
+
+async def chunks(data: bytes, size: int = 16) -> AsyncIterator[bytes]:
+    for start in range(0, len(data), size):
+        yield data[start : start + size]
+
+
+def test_complete_document_is_parsed_in_full() -> None:
+    assert parse_partial_result(DOCUMENT, max_rows=100) == {
+        "columns": COLUMNS,
+        "rows": ROWS,
+        "row_count": len(ROWS),
+    }
+
+
+def test_whitespace_between_tokens_is_allowed() -> None:
+    text = orjson.dumps(
+        {"columns": COLUMNS, "rows": ROWS, "row_count": len(ROWS)}, option=orjson.OPT_INDENT_2
+    ).decode()
+
+    assert parse_partial_result(text, max_rows=100)["rows"] == ROWS
+
+
+@pytest.mark.parametrize("cut", range(1, len(DOCUMENT)))
+def test_cut_off_document_keeps_only_complete_rows(cut: int) -> None:
+    result = parse_partial_result(DOCUMENT[:cut], max_rows=100)
+
+    if "rows" in result:
+        assert result["columns"] == COLUMNS
+        rows = result["rows"]
+        assert rows == ROWS[: len(rows)]
+        # A row counts only once it arrived in full
+        assert len(rows) == sum(
+            DOCUMENT.find(orjson.dumps(row).decode()) + len(orjson.dumps(row)) <= cut
+            for row in ROWS
+        )
+
+
+def test_rows_are_limited_to_max_rows() -> None:
+    result = parse_partial_result(DOCUMENT, max_rows=2)
+
+    assert result == {"columns": COLUMNS, "rows": ROWS[:2]}
+
+
+def test_non_object_is_rejected() -> None:
+    with pytest.raises(ValueError):
+        parse_partial_result("[1, 2", max_rows=10)
+
+
+async def test_oversized_response_is_cut_off(monkeypatch: pytest.MonkeyPatch) -> None:
+    monkeypatch.setattr(query_response, "MAX_RESPONSE_BYTES", len(DOCUMENT) // 2)
+
+    result, cut_off = await read_query_result(
+        httpx.Response(200, content=chunks(DOCUMENT.encode())), max_rows=100
+    )
+
+    assert cut_off
+    assert result["columns"] == COLUMNS
+    assert 0 < len(result["rows"]) < len(ROWS)
+
+
+async def test_small_response_is_read_in_full() -> None:
+    result, cut_off = await read_query_result(
+        httpx.Response(200, content=DOCUMENT.encode()), max_rows=100
+    )
+
+    assert not cut_off
+    assert result == orjson.loads(DOCUMENT)
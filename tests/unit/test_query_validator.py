@@ -0,0 +1,69 @@
+import time
+
+import pytest
+
+from infrastructure.database.query_validator import QueryValidator
+
+
+@pytest.fixture
+def validator() -> QueryValidator:
+    return QueryValidator()
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SELECT 1",
+        "  select * from users",
+        "WITH t AS (SELECT 1) SELECT * FROM t",
+        "(SELECT 1) UNION (SELECT 2)",
+        "/* c */ -- x\n ( select 1",
+    ],
+)
+def test_read_only_statements_are_accepted(validator: QueryValidator, query: str) -> None:
+    assert validator.is_read_only_statement(query)
+    assert validator.is_safe_query(query)
+
+
+@pytest.mark.parametrize(
+    "query",
+    [
+        "SHOW search_path",
+        "selectx 1",
+        "/* unterminated SELECT 1",
+        "-- SELECT 1",
+        "EXPLAIN SELECT 1",
+    ],
+)
+def test_other_statements_are_rejected(validator: QueryValidator, query: str) -> None:
+    assert not validator.is_read_only_statement(query)
+    assert not validator.is_safe_query(query)
+
+
+@pytest.mark.parametrize(
+    ("query", "keyword"),
+    [
+        ("WITH d AS (DELETE FROM t RETURNING *) SELECT * FROM d", "delete"),
+        ("select 1; drop table users", "drop"),
+        ("SELECT 1; Insert INTO t VALUES (1)", "insert"),
+    ],
+)
+def test_forbidden_keywords_are_reported(
+    validator: QueryValidator, query: str, keyword: str
+) -> None:
+    assert validator.get_forbidden_keyword(query) == keyword
+    assert not validator.is_safe_query(query)
+
+
+def test_keywords_inside_identifiers_are_allowed(validator: QueryValidator) -> None:
+    query = "SELECT created_at, updated_by FROM deleted_items"
+    assert validator.get_forbidden_keyword(query) is None
+    assert validator.is_safe_query(query)
+
+
+def test_prefix_check_is_linear_on_long_whitespace_runs(validator: QueryValidator) -> None:
+    """Leading whitespace must not trigger catastrophic regex backtracking."""
+    start = time.perf_counter()
+    assert not validator.is_read_only_statement(" " * 100_000 + "X")
+    assert not validator.is_read_only_statement("\n" * 50_000 + "(" * 50_000 + "X")
+    assert time.perf_counter() - start < 1.0
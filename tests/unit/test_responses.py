@@ -0,0 +1,115 @@
+import asyncio
+import datetime
+import json
+from collections.abc import AsyncGenerator
+from decimal import Decimal
+from typing import Any
+from uuid import UUID
+
+import orjson
+import pytest
+from asyncpg import Range  # type: ignore[import-untyped]
+from asyncpg.pgproto.types import Box, Circle, Point  # type: ignore[import-untyped]
+from starlette.types import Message
+
+from api.responses import QueryResultResponse, orjson_default
+from domain.entities.query_result import QueryResult
+
+
+def encode(value: Any) -> Any:
+    dumped = orjson.dumps([value], default=orjson_default, option=orjson.OPT_PASSTHROUGH_DATETIME)
+    return json.loads(dumped)[0]
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (Decimal("1.50"), "1.50"),
+        (Decimal("42"), "42"),
+        (Decimal("12345678901234567.89"), "12345678901234567.89"),
+        (Decimal("-123456789012345678901234567890"), "-123456789012345678901234567890"),
+        (Decimal("NaN"), "NaN"),
+        (datetime.timedelta(minutes=1), "PT1M"),
+        (datetime.datetime(2024, 1, 2, 3, 4, 5, tzinfo=datetime.UTC), "2024-01-02T03:04:05Z"),
+        (datetime.datetime(2024, 1, 2, 3, 4, 5), "2024-01-02T03:04:05"),
+        (datetime.date(2024, 1, 2), "2024-01-02"),
+        (UUID(int=1), "00000000-0000-0000-0000-000000000001"),
+        (b"raw", "raw"),
+        (b"\x00\xff", "\\x00ff"),
+        (Range(1, 5), "<Range [1, 5)>"),
+    ],
+)
+def test_converted_values(value: Any, expected: Any) -> None:
+    assert encode(value) == expected
+
+
+@pytest.mark.parametrize(
+    ("value", "expected"),
+    [
+        (Point(1, 2), [1.0, 2.0]),
+        (Box((3, 4), (1, 2)), [[3.0, 4.0], [1.0, 2.0]]),
+        (Circle((1, 2), 3), [[1.0, 2.0], 3.0]),
+    ],
+)
+def test_geometric_types_are_rendered_as_arrays(value: Any, expected: Any) -> None:
+    assert encode(value) == expected
+
+
+async def test_query_result_stream_renders_large_numerics_and_points() -> None:
+    async def batches() -> AsyncGenerator[list[tuple[Any, ...]], None]:
+        yield [(Decimal("123456789012345678901234567890"), Point(1, 2))]
+        yield [(Decimal("0.5"), None)]
+
+    response = await QueryResultResponse.create(QueryResult(columns=["n", "p"], batches=batches()))
+    body = b"".join([chunk async for chunk in response.body_iterator])  # type: ignore[misc]
+
+    assert json.loads(body) == {
+        "columns": ["n", "p"],
+        "rows": [["123456789012345678901234567890", [1.0, 2.0]], ["0.5", None]],
+        "row_count": 2,
+    }
+
+
+async def test_query_result_stream_closes_batches_on_client_disconnect() -> None:
+    closed = False
+
+    async def batches() -> AsyncGenerator[list[tuple[Any, ...]], None]:
+        nonlocal closed
+        try:
+            while True:
+                await asyncio.sleep(0)  # stands in for a cursor fetch
+                yield [(1,)]
+        finally:
+            closed = True
+
+    disconnected = asyncio.Event()
+
+    async def receive() -> Message:
+        await disconnected.wait()
+        return {"type": "http.disconnect"}
+
+    async def send(message: Message) -> None:
+        if message["type"] == "http.response.body":
+            disconnected.set()
+
+    response = await QueryResultResponse.create(QueryResult(columns=["n"], batches=batches()))
+    async with asyncio.timeout(5):
+        await response({"type": "http", "asgi": {"spec_version": "2.3"}}, receive, send)
+
+    assert closed
+
+
+async def test_query_result_first_batch_is_encoded_before_streaming() -> None:
+    closed = False
+
+    async def batches() -> AsyncGenerator[list[tuple[Any, ...]], None]:
+        nonlocal closed
+        try:
+            yield [(2**64,)]  # beyond the integers orjson encodes
+        finally:
+            closed = True
+
+    with pytest.raises(orjson.JSONEncodeError):
+        await QueryResultResponse.create(QueryResult(columns=["n"], batches=batches()))
+
+    assert closed
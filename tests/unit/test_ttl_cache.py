@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from infrastructure.cache.ttl_cache import AsyncTTLCache
+
+
+class CountingFactory:
+    """Lookup that counts its calls and can be held open until released."""
+
+    def __init__(self, value: str = "value") -> None:
+        self.value = value
+        self.calls = 0
+        self.started = asyncio.Event()
+        self.release = asyncio.Event()
+
+    async def __call__(self) -> str:
+        self.calls += 1
+        self.started.set()
+        await self.release.wait()
+        return self.value
+
+
+async def test_hit_does_not_call_factory() -> None:
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(maxsize=10, ttl=60)
+    factory = CountingFactory()
+    factory.release.set()
+
+    assert await cache.get_or_set("a", factory) == "value"
+    assert await cache.get_or_set("a", factory) == "value"
+    assert factory.calls == 1
+
+
+async def test_concurrent_misses_for_same_key_share_one_lookup() -> None:
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(maxsize=10, ttl=60)
+    factory = CountingFactory()
+
+    tasks = [asyncio.create_task(cache.get_or_set("a", factory)) for _ in range(5)]
+    await factory.started.wait()
+    factory.release.set()
+
+    assert await asyncio.gather(*tasks) == ["value"] * 5
+    assert factory.calls == 1
+
+
+async def test_misses_for_different_keys_run_in_parallel() -> None:
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(maxsize=10, ttl=60)
+    slow = CountingFactory("slow")
+    fast = CountingFactory("fast")
+    fast.release.set()
+
+    slow_task = asyncio.create_task(cache.get_or_set("slow", slow))
+    await slow.started.wait()
+
+    # Must not wait for the unrelated lookup still in progress
+    assert await asyncio.wait_for(cache.get_or_set("fast", fast), timeout=1) == "fast"
+
+    slow.release.set()
+    assert await slow_task == "slow"
+
+
+async def test_error_reaches_waiters_and_is_not_cached() -> None:
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(maxsize=10, ttl=60)
+    started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def failing() -> str:
+        started.set()
+        await release.wait()
+        raise LookupError("missing")
+
+    owner = asyncio.create_task(cache.get_or_set("a", failing))
+    await started.wait()
+    waiter = asyncio.create_task(cache.get_or_set("a", failing))
+    await asyncio.sleep(0)
+    release.set()
+
+    for task in (owner, waiter):
+        with pytest.raises(LookupError):
+            await task
+
+    factory = CountingFactory()
+    factory.release.set()
+    assert await cache.get_or_set("a", factory) == "value"
+    assert factory.calls == 1
+
+
+async def test_waiter_retries_when_lookup_owner_is_cancelled() -> None:
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(maxsize=10, ttl=60)
+    hanging = CountingFactory()
+    owner = asyncio.create_task(cache.get_or_set("a", hanging))
+    await hanging.started.wait()
+
+    factory = CountingFactory()
+    factory.release.set()
+    waiter = asyncio.create_task(cache.get_or_set("a", factory))
+    await asyncio.sleep(0)
+    owner.cancel()
+
+    assert await asyncio.wait_for(waiter, timeout=1) == "value"
+    assert factory.calls == 1
+
+
+async def test_cancelled_waiter_does_not_cancel_shared_lookup() -> None:
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(maxsize=10, ttl=60)
+    factory = CountingFactory()
+    owner = asyncio.create_task(cache.get_or_set("a", factory))
+    await factory.started.wait()
+
+    waiter = asyncio.create_task(cache.get_or_set("a", factory))
+    await asyncio.sleep(0)
+    waiter.cancel()
+    factory.release.set()
+
+    assert await owner == "value"
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+
+
+async def test_zero_ttl_disables_cache_and_single_flight() -> None:
+    cache: AsyncTTLCache[str, str] = AsyncTTLCache(maxsize=10, ttl=0)
+    factory = CountingFactory()
+
+    tasks = [asyncio.create_task(cache.get_or_set("a", factory)) for _ in range(3)]
+    while factory.calls < 3:
+        await asyncio.sleep(0)
+    factory.release.set()
+
+    assert await asyncio.gather(*tasks) == ["value"] * 3
+    assert await cache.get_or_set("a", factory) == "value"
+    assert factory.calls == 4
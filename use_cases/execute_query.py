@@ -26,10 +26,13 @@ class ExecuteQueryUseCase:
             ForbiddenQueryError: If query contains forbidden operations
             QueryExecutionError: If query execution fails
         """
-        # Validate query security
-        if not self._query_validator.is_safe_query(query):
-            forbidden_keyword = self._query_validator.get_forbidden_keyword(query)
+        # Validate query security; the keyword scan both decides and names
+        # the offending keyword, so the query is scanned only once
+        forbidden_keyword = self._query_validator.get_forbidden_keyword(query)
+        if forbidden_keyword is not None:
             raise ForbiddenQueryError(f"Query contains forbidden keyword: {forbidden_keyword}")
+        if not self._query_validator.is_read_only_statement(query):
+            raise ForbiddenQueryError("Only SELECT queries (optionally with WITH) are allowed")
 
         # Execute query
         return await self._repository.execute_query(query)
@@ -1,25 +1,30 @@
-from domain.entities.column_info import ColumnInfo, IndexInfo
 from domain.repositories.database_repository import DatabaseRepositoryProtocol
+from infrastructure.cache.ttl_cache import AsyncTTLCache
+
+SchemaCache = AsyncTTLCache[str, str]
 
 
 class GetTableSchemaUseCase:
     """Use case: Get detailed schema for specific table."""
 
-    def __init__(self, repository: DatabaseRepositoryProtocol) -> None:
+    def __init__(self, repository: DatabaseRepositoryProtocol, cache: SchemaCache) -> None:
         self._repository = repository
+        self._cache = cache
 
-    async def execute(
-        self, table_name: str
-    ) -> tuple[list[ColumnInfo], list[IndexInfo], str | None]:
+    async def execute(self, table_name: str) -> str:
         """Execute get table schema use case.
 
+        Schemas are served from a short-lived cache; missing tables are not cached.
+
         Args:
             table_name: Name of the table
 
         Returns:
-            Tuple of (columns, indexes, table_comment)
+            Table schema as a JSON document
 
         Raises:
             TableNotFoundError: If table doesn't exist
         """
-        return await self._repository.get_table_schema(table_name)
+        return await self._cache.get_or_set(
+            table_name, lambda: self._repository.get_table_schema(table_name)
+        )
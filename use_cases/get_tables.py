@@ -1,17 +1,23 @@
 from domain.entities.pagination import Pagination
 from domain.entities.table_info import TableInfo
 from domain.repositories.database_repository import DatabaseRepositoryProtocol
+from infrastructure.cache.ttl_cache import AsyncTTLCache
+
+TablesCache = AsyncTTLCache[tuple[int, int], tuple[list[TableInfo], Pagination]]
 
 
 class GetTablesUseCase:
     """Use case: Get paginated list of database tables."""
 
-    def __init__(self, repository: DatabaseRepositoryProtocol) -> None:
+    def __init__(self, repository: DatabaseRepositoryProtocol, cache: TablesCache) -> None:
         self._repository = repository
+        self._cache = cache
 
     async def execute(self, page: int, page_size: int) -> tuple[list[TableInfo], Pagination]:
         """Execute get tables use case.
 
+        Pages are served from a short-lived cache, since the catalog rarely changes.
+
         Args:
             page: Page number (1-based)
             page_size: Items per page (1-100)
@@ -19,6 +25,12 @@ class GetTablesUseCase:
         Returns:
             Tuple of (tables list, pagination info)
         """
+        return await self._cache.get_or_set(
+            (page, page_size), lambda: self._fetch_tables(page, page_size)
+        )
+
+    async def _fetch_tables(self, page: int, page_size: int) -> tuple[list[TableInfo], Pagination]:
+        """Fetch a page of tables from the repository."""
         pagination = Pagination(page=page, page_size=page_size, total_count=0)
         tables, total_count = await self._repository.get_tables(pagination)
 